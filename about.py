@@ -1,8 +1,12 @@
 import sys
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QApplication, QSizePolicy, QScrollArea, QWidget
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QPixmapCache
 from PySide6.QtCore import Qt, QCoreApplication
-from . import core
+from shiboken6 import isValid
+from . import core  # noqa: F401  imported for its rischio_rc import, which registers :/icons/
+
+# Dialog reused by show_about()
+_instance = None
 
 class AboutDialog(QDialog):
     def __init__(self, parent=None, open_source_projects=None):
@@ -21,8 +25,10 @@ class AboutDialog(QDialog):
         self.app_name = QCoreApplication.applicationName()
         self.app_version = QCoreApplication.applicationVersion()
 
-        # Create a vertical layout
+        # Create a vertical layout, held inactive until every widget is added
+        # so the dialog is laid out once instead of after each addWidget
         layout = QVBoxLayout(self)
+        layout.setEnabled(False)
 
         # Company Name
         company_label = QLabel(f"<h2>{self.app_name}</h2>")
@@ -30,11 +36,13 @@ class AboutDialog(QDialog):
         layout.addWidget(company_label)
 
         # Display the icon in the dialog
-        # The icon will be in this module's resources
-        icon_pixmap = QPixmap(core.resourcePath('icons/rischio.png'))
+        # The icon is compiled into this module's Qt resources (rischio_rc.py)
+        # Pre-scaled copies are included; pick the one matching the screen
+        pixel_ratio = 2.0 if self.devicePixelRatioF() > 1.0 else 1.0
+        icon_pixmap = self._load_icon(pixel_ratio)
         if not icon_pixmap.isNull():
             icon_label = QLabel()
-            icon_label.setPixmap(icon_pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            icon_label.setPixmap(icon_pixmap)
             icon_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(icon_label)
 
@@ -71,10 +79,12 @@ class AboutDialog(QDialog):
             # Container widget for projects
             projects_widget = QWidget()
             projects_layout = QVBoxLayout(projects_widget)
+            projects_layout.setEnabled(False)
             projects_layout.setContentsMargins(5, 5, 5, 5)
             projects_layout.setSpacing(5)
 
-            # Add each project as a clickable link
+            # Collect each project as a clickable link
+            project_links = []
             for project in self.open_source_projects:
                 if isinstance(project, dict):
                     name = project.get('name', 'Unknown')
@@ -83,18 +93,60 @@ class AboutDialog(QDialog):
                     name, url = project
                 else:
                     continue  # Skip invalid entries
+                project_links.append(f'<a href="{url}">{name}</a>')
 
-                project_link = QLabel(f'<a href="{url}">{name}</a>')
-                project_link.setAlignment(Qt.AlignCenter)
-                project_link.setOpenExternalLinks(True)
-                projects_layout.addWidget(project_link)
+            # All links share one rich text label so Qt lays them out in a single pass
+            projects_label = QLabel("<br>".join(project_links))
+            projects_label.setTextFormat(Qt.RichText)
+            projects_label.setAlignment(Qt.AlignCenter)
+            projects_label.setOpenExternalLinks(True)
+            projects_label.setWordWrap(True)
+            projects_layout.addWidget(projects_label)
 
             projects_layout.addStretch()
+            projects_layout.setEnabled(True)
             scroll_area.setWidget(projects_widget)
             layout.addWidget(scroll_area)
 
+        layout.setEnabled(True)
+        layout.activate()
+
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
+    @staticmethod
+    def _load_icon(pixel_ratio=1.0):
+        """Returns the 64x64 icon at pixel_ratio, loading it from the Qt resources only on first use."""
+        size = int(64 * pixel_ratio)
+        path = f':/icons/rischio_{size}.png'
+        icon_pixmap = QPixmapCache.find(path)
+        if icon_pixmap is None or icon_pixmap.isNull():
+            icon_pixmap = QPixmap(path)
+            if icon_pixmap.isNull():
+                return icon_pixmap
+            # The bundled icons are already at target size; only resample a replaced asset,
+            # and only pay for smooth filtering on large downscales
+            if icon_pixmap.width() != size or icon_pixmap.height() != size:
+                transform = Qt.FastTransformation if icon_pixmap.width() < 4 * size else Qt.SmoothTransformation
+                icon_pixmap = icon_pixmap.scaled(size, size, Qt.KeepAspectRatio, transform)
+            icon_pixmap.setDevicePixelRatio(pixel_ratio)
+            QPixmapCache.insert(path, icon_pixmap)
+        return icon_pixmap
+
+def show_about(parent=None, open_source_projects=None):
+    """Shows the About dialog, building it on first use and raising the existing one after that."""
+    global _instance
+    if (_instance is None or not isValid(_instance)
+            or _instance.parent() is not parent
+            or _instance.open_source_projects != (open_source_projects or [])):
+        if _instance is not None and isValid(_instance):
+            _instance.close()
+            _instance.deleteLater()
+        _instance = AboutDialog(parent, open_source_projects)
+    _instance.show()
+    _instance.raise_()
+    _instance.activateWindow()
+    return _instance
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
 
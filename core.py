@@ -1,34 +1,82 @@
+import functools
 import os
+import shlex
 import subprocess
 import sys
+import threading
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import QApplication
+from . import rischio_rc  # noqa: F401  registers the :/icons/ Qt resources
 
-# def log_info(message, module=None):
-#     prefix = f"[{module}]" if module else ""
-#     print(f"[{QtCore.QCoreApplication.applicationName()}]{prefix}[INFO]: {message}")
+# Debug flag read by log_debug; None until set_debug() or the first log_debug call
+_DEBUG = None
 
-# def log_error(message, module=None):
-#     prefix = f"[{module}]" if module else ""
-#     print(f"[{QtCore.QCoreApplication.applicationName()}]{prefix}[ERROR]: {message}", file=sys.stderr)
+def set_debug(flag):
+    """Enable or disable log_debug output (mirrored to the app's "debug" property)."""
+    global _DEBUG
+    _DEBUG = bool(flag)
+    app = QApplication.instance()
+    if app:
+        app.setProperty("debug", _DEBUG)
 
-# def log_debug(message, module=None):
-#     prefix = f"[{module}]" if module else ""
-#     app = QApplication.instance()
-#     if app and app.property("debug"):
-#         print(f"[{QtCore.QCoreApplication.applicationName()}]{prefix}[DEBUG]: {message}")
+# "[AppName]" and the per level "[AppName][LEVEL]: " prefixes, built on the first
+# log call once a QCoreApplication exists (the app name is fixed by then)
+_APP_PREFIX = None
+_LEVEL_PREFIXES = {}
 
-# def log_warning(message, module=None):
-#     prefix = f"[{module}]" if module else ""
-#     print(f"[{QtCore.QCoreApplication.applicationName()}]{prefix}[WARNING]: {message}")
+def _log_prefix(level, module):
+    global _APP_PREFIX
+    if _APP_PREFIX is None:
+        app_prefix = f"[{QtCore.QCoreApplication.applicationName()}]"
+        if QtCore.QCoreApplication.instance() is None:
+            # Too early to cache, the app name may still change
+            return f"{app_prefix}[{module}][{level}]: " if module else f"{app_prefix}[{level}]: "
+        _APP_PREFIX = app_prefix
+        for name in ("INFO", "ERROR", "DEBUG", "WARNING"):
+            _LEVEL_PREFIXES[name] = f"{app_prefix}[{name}]: "
+    if module:
+        return f"{_APP_PREFIX}[{module}][{level}]: "
+    return _LEVEL_PREFIXES[level]
+
+def log_info(message, module=None):
+    sys.stdout.write(f"{_log_prefix('INFO', module)}{message}\n")
+
+def log_error(message, module=None):
+    sys.stderr.write(f"{_log_prefix('ERROR', module)}{message}\n")
+
+def log_debug(message, module=None):
+    global _DEBUG
+    if _DEBUG is None:
+        # Fall back to the app property once, for apps that don't call set_debug()
+        app = QApplication.instance()
+        if app is None:
+            return
+        _DEBUG = bool(app.property("debug"))
+    if _DEBUG:
+        sys.stdout.write(f"{_log_prefix('DEBUG', module)}{message}\n")
+
+def log_warning(message, module=None):
+    sys.stdout.write(f"{_log_prefix('WARNING', module)}{message}\n")
 
 def resourcePath(relative_path):
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, relative_path)
     return relative_path
 
+# QSettings instances keyed by application name, one set per thread since
+# QSettings is reentrant but not thread-safe
+_SETTINGS_CACHE = threading.local()
+
 def get_app_settings():
-    return QtCore.QSettings("rischio", QtCore.QCoreApplication.applicationName())
+    app_name = QtCore.QCoreApplication.applicationName()
+    cache = getattr(_SETTINGS_CACHE, "by_app", None)
+    if cache is None:
+        cache = _SETTINGS_CACHE.by_app = {}
+    settings = cache.get(app_name)
+    if settings is None:
+        settings = QtCore.QSettings("rischio", app_name)
+        cache[app_name] = settings
+    return settings
 
 def reset_settings():
     settings = get_app_settings()
@@ -36,15 +84,58 @@ def reset_settings():
 
 def get_setting(key, default=None):
     settings = get_app_settings()
-    if key in settings.allKeys():
-        return settings.value(key)
+    if settings.contains(key):
+        return settings.value(key, default)
     print(f"Setting {key} not found in settings, returning default value")
     return default
 
-def runCommand(command, detach=False, env=None):
-    # Determine if we need shell based on command type
-    # Use shell=True for strings, shell=False for lists (safer for paths with spaces)
-    use_shell = isinstance(command, str)
+def set_setting(key, value):
+    settings = get_app_settings()
+    settings.setValue(key, value)
+
+# Characters that need a real shell (pipes, redirects, expansion, globbing, ...)
+_SHELL_CHARS = frozenset('|&;<>()$`*?[]{}~#!\n')
+
+# Builtins and keywords that only exist inside a shell, so they can't be exec'd
+_SHELL_BUILTINS = frozenset((
+    ".", ":", "alias", "bg", "break", "cd", "command", "continue", "declare",
+    "dirs", "disown", "echo", "eval", "exec", "exit", "export", "false", "fg",
+    "getopts", "hash", "history", "jobs", "kill", "let", "local", "popd",
+    "printf", "pushd", "pwd", "read", "readonly", "return", "set", "shift",
+    "source", "test", "times", "trap", "true", "type", "typeset", "ulimit",
+    "umask", "unalias", "unset", "wait", "case", "do", "done", "elif", "else",
+    "esac", "fi", "for", "function", "if", "in", "select", "then", "time",
+    "until", "while",
+))
+
+@functools.lru_cache(maxsize=64)
+def _split_command(command):
+    """Returns command as an argv tuple, or None if it relies on shell syntax."""
+    if os.name == "nt" or any(char in _SHELL_CHARS for char in command):
+        return None
+    try:
+        argv = tuple(shlex.split(command))
+    except ValueError:
+        return None
+    # Leading VAR=value assignments and shell builtins still need the shell
+    if not argv or "=" in argv[0] or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
+def runCommand(command, detach=False, env=None, on_start=None, decode=True):
+    # Plain string commands are split into argv so no intermediate shell is started
+    # (subprocess can then use posix_spawn); strings using shell syntax still run
+    # through the shell. Lists are passed straight through with shell=False.
+    # on_start, if given, is called with the Popen object of a synchronous command
+    # so callers on another thread can terminate it. With decode=False the output
+    # is returned as bytes for callers that only decode what they actually use.
+    use_shell = False
+    if isinstance(command, str):
+        argv = _split_command(command)
+        if argv is None:
+            use_shell = True
+        else:
+            command = list(argv)
 
     if detach:
         # Start process in detached mode
@@ -53,39 +144,61 @@ def runCommand(command, detach=False, env=None):
             shell=use_shell,
             stdout=subprocess.DEVNULL,  # Ignore output
             stderr=subprocess.DEVNULL,
-            env=env
+            env=env,
+            start_new_session=os.name != "nt"
         )
         return process.pid  # Return the process ID of the detached process
     else:
-        # Normal execution (waits for completion)
-        process = subprocess.Popen(
-            command,
-            shell=use_shell,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env
-        )
-        cmd_output, cmd_err = process.communicate()
-        code = process.returncode
-        return (cmd_output.decode("utf-8").strip(), cmd_err.decode("utf-8").strip(), code)
+        # Normal execution (waits for completion), decoding output as it is read
+        try:
+            process = subprocess.Popen(
+                command,
+                shell=use_shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding="utf-8" if decode else None,
+                env=env
+            )
+        except FileNotFoundError as e:
+            # Match the shell's "command not found" result now that no shell is involved
+            if decode:
+                return ("", str(e), 127)
+            return (b"", str(e).encode("utf-8"), 127)
+        with process:
+            if on_start is not None:
+                on_start(process)
+            cmd_output, cmd_err = process.communicate()
+        return (cmd_output.strip(), cmd_err.strip(), process.returncode)
 
 
-def set_dark_palette(app):
-    """Apply a Dark Fusion Theme"""
+_DARK_PALETTE = None
+_DARK_WINDOW_COLOR = QtGui.QColor(53, 53, 53)
+_DARK_BASE_COLOR = QtGui.QColor(25, 25, 25)
+
+
+def _build_dark_palette():
     dark_palette = QtGui.QPalette()
     # Base Colors
-    dark_palette.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
+    dark_palette.setColor(QtGui.QPalette.Window, _DARK_WINDOW_COLOR)
     dark_palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    dark_palette.setColor(QtGui.QPalette.Base, QtGui.QColor(25, 25, 25))
-    dark_palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
+    dark_palette.setColor(QtGui.QPalette.Base, _DARK_BASE_COLOR)
+    dark_palette.setColor(QtGui.QPalette.AlternateBase, _DARK_WINDOW_COLOR)
     dark_palette.setColor(QtGui.QPalette.ToolTipBase, QtCore.Qt.black)
     dark_palette.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
     dark_palette.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    dark_palette.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
+    dark_palette.setColor(QtGui.QPalette.Button, _DARK_WINDOW_COLOR)
     dark_palette.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
     dark_palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
     # Disabled Colors
     dark_palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, QtCore.Qt.darkGray)
     dark_palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, QtCore.Qt.darkGray)
     dark_palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, QtCore.Qt.darkGray)
-    app.setPalette(dark_palette)
\ No newline at end of file
+    return dark_palette
+
+
+def set_dark_palette(app):
+    """Apply a Dark Fusion Theme"""
+    global _DARK_PALETTE
+    if _DARK_PALETTE is None:
+        _DARK_PALETTE = _build_dark_palette()
+    app.setPalette(_DARK_PALETTE)
\ No newline at end of file
@@ -1,24 +1,49 @@
 import os
+import functools
+import subprocess
 from PySide6 import QtWidgets, QtCore
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QFontMetrics
-from PySide6.QtWidgets import QPushButton
-from PySide6.QtCore import QTimer
-from .core import runCommand
-
+from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtGui import QFontMetrics, QColor
+from PySide6.QtWidgets import QPushButton, QGraphicsDropShadowEffect
+from shiboken6 import isValid
+from .core import runCommand, log_info, log_error
+
+
+# Message box reused by notify_user / show_message while the parent stays the same
+_MESSAGE_BOX = None
+
+def _message_box(parent=None):
+    global _MESSAGE_BOX
+    if _MESSAGE_BOX is not None and isValid(_MESSAGE_BOX) and _MESSAGE_BOX.isVisible():
+        # Still open (a message shown from its own event loop); use a fresh one
+        return QtWidgets.QMessageBox(parent)
+    if _MESSAGE_BOX is None or not isValid(_MESSAGE_BOX) or _MESSAGE_BOX.parent() is not parent:
+        _MESSAGE_BOX = QtWidgets.QMessageBox(parent)
+    else:
+        # Undo whatever a caller set on the returned box after its last message
+        for button in _MESSAGE_BOX.buttons():
+            _MESSAGE_BOX.removeButton(button)
+            button.deleteLater()
+        _MESSAGE_BOX.setIcon(QtWidgets.QMessageBox.NoIcon)
+        _MESSAGE_BOX.setInformativeText("")
+        _MESSAGE_BOX.setDetailedText("")
+    return _MESSAGE_BOX
 
 def notify_user(title, message):
-    msg_box = QtWidgets.QMessageBox()  # Create a new QMessageBox
+    msg_box = _message_box()  # Reuse the shared QMessageBox
     msg_box.setWindowTitle(title)  # Set the title for the message box
     msg_box.setText(message)  # Set the text for the message box
     msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)  # Add an OK button to the message box
+    msg_box.setDefaultButton(QtWidgets.QMessageBox.Ok)
     msg_box.exec()  # Execute the message box
     return msg_box
 
 def show_message(title, message, parent=None):
-    msg_box = QtWidgets.QMessageBox(parent)
+    msg_box = _message_box(parent)
     msg_box.setWindowTitle(title)
     msg_box.setText(message)
+    msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
+    msg_box.setDefaultButton(QtWidgets.QMessageBox.Ok)
     msg_box.exec()
     return msg_box
 
@@ -30,14 +55,36 @@ class FocusReleaseSpinBox(QtWidgets.QSpinBox):
         else:
             super().keyPressEvent(event)  # Default behavior
 
+# QFontMetrics per font, keyed by QFont.key()
+_FONT_METRICS_CACHE = {}
+
 def set_fixed_label_size(label, sample_text):
     """Sets a fixed size hint for QLabel based on sample text width."""
-    font_metrics = QFontMetrics(label.font())
-    text_width = font_metrics.boundingRect(sample_text).width()
-    text_height = font_metrics.boundingRect(sample_text).height()
+    font = label.font()
+    font_metrics = _FONT_METRICS_CACHE.get(font.key())
+    if font_metrics is None:
+        font_metrics = QFontMetrics(font)
+        _FONT_METRICS_CACHE[font.key()] = font_metrics
+    text_rect = font_metrics.boundingRect(sample_text)
 
     # Set minimum size to fit the widest possible text
-    label.setMinimumSize(text_width, text_height)
+    label.setMinimumSize(text_rect.width(), text_rect.height())
+
+@functools.lru_cache(maxsize=16)
+def _std_icon_pixmap(name, size=32):
+    """Returns the application style's standard icon as a pixmap, shared across widgets."""
+    return QtWidgets.QApplication.style().standardIcon(getattr(QtWidgets.QStyle, name)).pixmap(size, size)
+
+# Application style the cached pixmaps were last cleared for
+_STD_ICON_STYLE = None
+
+def _sync_std_icon_style():
+    """Clears the shared pixmaps once per application style change, not once per widget."""
+    global _STD_ICON_STYLE
+    style = QtWidgets.QApplication.style()
+    if _STD_ICON_STYLE is not style or not isValid(_STD_ICON_STYLE):
+        _std_icon_pixmap.cache_clear()
+        _STD_ICON_STYLE = style
 
 class FilePicker(QtWidgets.QWidget):
     textChanged = QtCore.Signal(str)
@@ -60,6 +107,12 @@ class FilePicker(QtWidgets.QWidget):
             self.line_edit.setPlaceholderText(placeholder_text)
         self.line_edit.textChanged.connect(self.updateLabel)
         self.status_label = QtWidgets.QLabel()
+        self._load_icons()
+        # Coalesce path existence checks while the user is typing
+        self._exists_timer = QTimer(self)
+        self._exists_timer.setSingleShot(True)
+        self._exists_timer.setInterval(150)
+        self._exists_timer.timeout.connect(self._update_status_icon)
         hbox = QtWidgets.QHBoxLayout()
         hbox.addWidget(self.line_edit)
         hbox.addWidget(self.button)
@@ -68,6 +121,22 @@ class FilePicker(QtWidgets.QWidget):
         self.updateLabel("")
 
 
+    def _load_icons(self):
+        """Status icons are rasterized once and shared by every FilePicker."""
+        _sync_std_icon_style()
+        self._icons = {
+            "empty": _std_icon_pixmap("SP_FileIcon"),
+            "ok": _std_icon_pixmap("SP_DialogApplyButton"),
+            "warn": _std_icon_pixmap("SP_MessageBoxWarning"),
+        }
+
+    def changeEvent(self, event):
+        """Reload the shared icons when the style changes so they come from the new one."""
+        if event.type() == QtCore.QEvent.StyleChange:
+            self._load_icons()
+            self._update_status_icon()
+        super().changeEvent(event)
+
     def open_file_dialog(self):
         file_dialog = QtWidgets.QFileDialog(self)
         if self.filepath_root is not None and os.path.exists(self.filepath_root):
@@ -88,16 +157,24 @@ class FilePicker(QtWidgets.QWidget):
 
     def updateLabel(self, current_text):
         if current_text.strip() == "":
-            icon_name = "SP_FileIcon"
-        elif os.path.exists(current_text):
-            icon_name = "SP_DialogApplyButton"
+            self._exists_timer.stop()
+            self.status_label.setPixmap(self._icons["empty"])
         else:
-            icon_name = "SP_MessageBoxWarning"
-        icon = self.style().standardIcon(getattr(QtWidgets.QStyle, icon_name))
-        # Set the icon to the label
-        self.status_label.setPixmap(icon.pixmap(32, 32))  # Adjust the size as needed=
+            # Restarting the timer drops the check for the previous keystroke
+            self._exists_timer.start()
         self.textChanged.emit(current_text)
 
+    def _update_status_icon(self):
+        """Set the status icon for the text the user settled on."""
+        current_text = self.line_edit.text()
+        if current_text.strip() == "":
+            icon_key = "empty"
+        elif os.path.exists(current_text):
+            icon_key = "ok"
+        else:
+            icon_key = "warn"
+        self.status_label.setPixmap(self._icons[icon_key])
+
     def text(self):
         return self.line_edit.text()
 
@@ -109,16 +186,42 @@ class FilePicker(QtWidgets.QWidget):
 
 
 class CommandWorker(QtWidgets.QDialog):
-    class Worker(QObject):
-        complete = Signal(str, str, int)
+    class Signals(QObject):
+        complete = Signal(bytes, bytes, int)
 
+    class Worker(QtCore.QRunnable):
         def __init__(self, command):
             super().__init__()
             self.command = command
+            self.signals = CommandWorker.Signals()
+            # The dialog keeps the reference; don't let the pool delete it after run()
+            self.setAutoDelete(False)
+            self._proc = None
+            self._cancelled = False
 
         def run(self):
-            out, err, code = runCommand(self.command)
-            self.complete.emit(out, err, code)
+            # Output stays as bytes; the dialog only decodes what it logs
+            out, err, code = runCommand(self.command, on_start=self._set_process, decode=False)
+            if not self._cancelled:
+                self.signals.complete.emit(out, err, code)
+
+        def _set_process(self, process):
+            self._proc = process
+            # Cancelled before the process existed
+            if self._cancelled:
+                process.terminate()
+
+        def cancel(self):
+            """Stop the running process, escalating to kill if it ignores terminate."""
+            self._cancelled = True
+            process = self._proc
+            if process is None or process.poll() is not None:
+                return
+            process.terminate()
+            try:
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                process.kill()
 
     """A Qt dialog that runs a command and shows a progress bar."""
     def __init__(self, command, title, message, parent=None):
@@ -135,46 +238,34 @@ class CommandWorker(QtWidgets.QDialog):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
 
         print("Command: ", command)
-        self.thread_run = QtCore.QThread()
 
         layout.addWidget(self.label)
         layout.addWidget(self.progress_bar)
         self.setLayout(layout)
 
         self.worker = CommandWorker.Worker(command)
-        self.worker.moveToThread(self.thread_run)
-        self.worker.complete.connect(self.complete)
-        self.thread_run.started.connect(self.worker.run)
-        self.thread_run.start()
+        self.worker.signals.complete.connect(self.complete)
+        QtCore.QThreadPool.globalInstance().start(self.worker)
 
     def exec(self):
         """Show the dialog and start the command."""
         super().exec()
-        self.thread_run.quit()
-        self.thread_run.wait()
         self.close()
 
     def cancel(self):
         """Cancel the command."""
         print("Cancelling command")
-        self.thread_run.exit()
-        self.thread_run.wait()
+        self.worker.cancel()
         self.close()
 
     def complete(self, out, err, code):
         print("Command complete")
         """Handle the completion of the command."""
-        log_info(out)
+        log_info(out.decode("utf-8", "replace"))
         if code != 0:
-            log_error(err)
-        self.thread_run.quit()
-        self.thread_run.wait()
+            log_error(err.decode("utf-8", "replace"))
         self.close()
 
-from PySide6.QtWidgets import QPushButton, QGraphicsDropShadowEffect
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QColor
-
 
 class BlinkButton(QPushButton):
     def __init__(self, text: str = "", parent=None):
@@ -1,16 +1,16 @@
+import asyncio
 import sys
-import time
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton,
                              QVBoxLayout, QWidget, QDialog, QLabel,
-                             QProgressBar, QHBoxLayout)
-from PySide6.QtCore import (Qt, QThread, Signal, QTimer,
-                           QPropertyAnimation, QRect, QEasingCurve)
-from PySide6.QtGui import QMovie, QPainter, QColor, QFont, QPalette
+                             QProgressBar)
+from PySide6.QtCore import (Qt, QThread, Signal, QTimer, QObject, QRunnable,
+                           QRect, QPointF, QThreadPool)
+from PySide6.QtGui import QPainter, QColor, QFont, QPixmap, QImage
 
 
 class Worker(QThread):
     """Worker thread for running background operations"""
-    finished = Signal()
+    # finished is QThread's own signal, emitted once run() returns
     progress = Signal(int)
     error = Signal(str)
     result = Signal(object)
@@ -28,8 +28,40 @@ class Worker(QThread):
             self.result.emit(result)
         except Exception as e:
             self.error.emit(str(e))
+
+
+class WorkerSignals(QObject):
+    """Signals for WorkerRunnable (QRunnable is not a QObject and cannot own signals)"""
+    finished = Signal()
+    progress = Signal(int)
+    error = Signal(str)
+    result = Signal(object)
+
+
+class WorkerRunnable(QRunnable):
+    """Runs a background operation on QThreadPool.globalInstance() instead of a new thread
+
+    The pool does not take ownership, so the caller must keep a reference to the
+    runnable until finished is emitted or its signals may be collected early.
+    """
+
+    def __init__(self, operation, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.operation = operation
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            # Run the operation
+            result = self.operation(*self.args, **self.kwargs)
+            self.signals.result.emit(result)
+        except Exception as e:
+            self.signals.error.emit(str(e))
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
 
 
 class LoadingDialog(QDialog):
@@ -38,7 +70,7 @@ class LoadingDialog(QDialog):
     def __init__(self, parent=None, message="Loading..."):
         super().__init__(parent)
         self.setWindowTitle("Processing")
-        self.setModal(True)
+        self.setWindowModality(Qt.ApplicationModal)
         self.setFixedSize(300, 150)
 
         # Remove window frame for cleaner look
@@ -55,61 +87,84 @@ class LoadingDialog(QDialog):
         font.setPointSize(10)
         self.message_label.setFont(font)
 
-        # Create spinning dots animation
-        self.dots_label = QLabel("...")
-        self.dots_label.setAlignment(Qt.AlignCenter)
-
-        # Progress bar (indeterminate)
+        # Progress bar (indeterminate, its busy animation is the activity indicator)
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 0)  # Indeterminate mode
         self.progress_bar.setTextVisible(False)
 
         # Add widgets to layout
         layout.addWidget(self.message_label)
-        layout.addWidget(self.dots_label)
         layout.addWidget(self.progress_bar)
 
         self.setLayout(layout)
 
-        # Setup animation timer for dots
-        self.dots_timer = QTimer()
-        self.dots_timer.timeout.connect(self.animate_dots)
-        self.dots_count = 0
-        self.dots_timer.start(500)  # Update every 500ms
-
-    def animate_dots(self):
-        """Animate the dots to show processing"""
-        dots = ["", ".", "..", "...", "..", "."]
-        self.dots_label.setText(dots[self.dots_count % len(dots)])
-        self.dots_count += 1
+        # Called when the dialog is closed before its operation finishes
+        self.cancel_callback = None
 
     def set_message(self, message):
         """Update the loading message"""
         self.message_label.setText(message)
 
-    def closeEvent(self, event):
-        """Stop timers when closing"""
-        self.dots_timer.stop()
-        super().closeEvent(event)
+    def set_cancel_callback(self, callback):
+        """Set a function called once if the dialog is closed while its operation runs
+
+        Closing with accept() doesn't call it; set None once the operation finishes.
+        """
+        self.cancel_callback = callback
+
+    def done(self, result):
+        """Cancel the running operation when closing"""
+        # close(), Escape and reject() all end up here; accept() means it finished
+        callback, self.cancel_callback = self.cancel_callback, None
+        if callback and result != QDialog.Accepted:
+            callback()
+        super().done(result)
 
 
 class SpinnerDialog(QDialog):
     """Alternative loading dialog with custom spinner animation - Dark Theme"""
 
+    # Degrees the spinner turns per timer tick
+    _ANGLE_STEP = 20
+    # Pre-rendered spinner frames shared by all dialogs, keyed by device pixel ratio
+    _frame_cache = {}
+
     def __init__(self, parent=None, message="Processing..."):
         super().__init__(parent)
         self.setWindowTitle("Loading")
-        self.setModal(True)
+        self.setWindowModality(Qt.ApplicationModal)
         self.setFixedSize(250, 250)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
 
         self.angle = 0
         self.message = message
 
+        # Paint resources are built once instead of every frame
+        self._dot_colors = []
+        for i in range(12):
+            color = QColor(74, 144, 226)  # Blue accent color
+            color.setAlphaF(1.0 - (i / 12.0))
+            self._dot_colors.append(color)
+        self._background_color = QColor(53, 53, 53)
+        self._text_color = QColor(255, 255, 255)
+        self._message_font = QFont()
+        self._message_font.setPointSize(10)
+        self._message_font.setBold(True)
+
+        # Only the dots move; the rest of the dialog is repainted when the message changes
+        self._dots_center = (self.width() / 2, self.height() / 2 - 20)
+        center_x, center_y = int(self._dots_center[0]), int(self._dots_center[1])
+        self._dots_rect = QRect(center_x - 32, center_y - 32, 64, 64)
+        self._text_rect = self.rect().adjusted(0, 60, 0, 0)
+        self._text_pixmap = None
+
         # Animation timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.rotate)
-        self.timer.start(50)  # Update every 50ms
+        self.timer.start(100)  # Update every 100ms
+
+        # Called when the dialog is closed before its operation finishes
+        self.cancel_callback = None
 
         # Dark theme style
         self.setStyleSheet("""
@@ -123,55 +178,116 @@ class SpinnerDialog(QDialog):
     def paintEvent(self, event):
         """Custom paint event for spinner"""
         painter = QPainter(self)
+        # Skip everything outside the area Qt asked us to repaint
+        painter.setClipRegion(event.region())
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw dark background
-        painter.fillRect(self.rect(), QColor(53, 53, 53))
-
+        painter.fillRect(event.rect(), self._background_color)
+
+        # Blit the pre-rendered spinner frame for the current angle
+        if event.rect().intersects(self._dots_rect):
+            frames = self._spinner_frames()
+            painter.drawPixmap(self._dots_rect.topLeft(), frames[self.angle // self._ANGLE_STEP])
+
+        # Draw the pre-rendered message
+        if event.rect().intersects(self._text_rect):
+            if self._text_pixmap is None:
+                self._text_pixmap = self._render_message()
+            painter.drawPixmap(self._text_rect.topLeft(), self._text_pixmap)
+
+    def _spinner_frames(self):
+        """Return one pixmap of the dots per rotation step, rendering them on first use"""
+        ratio = self.devicePixelRatioF()
+        frames = self._frame_cache.get(ratio)
+        if frames is None:
+            wheel = self._render_wheel(ratio)
+            offset_x = self._dots_center[0] - self._dots_rect.x()
+            offset_y = self._dots_center[1] - self._dots_rect.y()
+            half = self._dots_rect.width() / 2
+            frames = []
+            for angle in range(0, 360, self._ANGLE_STEP):
+                pixmap = QPixmap(self._dots_rect.size() * ratio)
+                pixmap.setDevicePixelRatio(ratio)
+                pixmap.fill(self._background_color)
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.translate(offset_x, offset_y)
+                painter.rotate(angle)
+                painter.drawImage(QPointF(-half, -half), wheel)
+                painter.end()
+                frames.append(pixmap)
+            self._frame_cache[ratio] = frames
+        return frames
+
+    def _render_wheel(self, ratio):
+        """Rasterize the 12 dots once into a premultiplied image, centered on the wheel"""
+        size = self._dots_rect.size() * ratio
+        wheel = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        wheel.setDevicePixelRatio(ratio)
+        wheel.fill(Qt.transparent)
+        painter = QPainter(wheel)
+        painter.setRenderHint(QPainter.Antialiasing)
         # Draw spinner with blue accent color
-        painter.translate(self.width() / 2, self.height() / 2 - 20)
-        painter.rotate(self.angle)
-
-        for i in range(12):
-            color = QColor(74, 144, 226)  # Blue accent color
-            color.setAlphaF(1.0 - (i / 12.0))
-            painter.setPen(Qt.NoPen)
+        painter.translate(self._dots_rect.width() / 2, self._dots_rect.height() / 2)
+        painter.setPen(Qt.NoPen)
+        for color in self._dot_colors:
             painter.setBrush(color)
             painter.drawEllipse(-4, -30, 8, 15)
             painter.rotate(30)
-
-        painter.resetTransform()
-
-        # Draw message in white
-        painter.setPen(QColor(255, 255, 255))
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(self.rect().adjusted(0, 60, 0, 0),
+        painter.end()
+        return wheel
+
+    def _render_message(self):
+        """Render the message in white into a transparent pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self._text_rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(self._text_color)
+        painter.setFont(self._message_font)
+        painter.drawText(QRect(0, 0, self._text_rect.width(), self._text_rect.height()),
                         Qt.AlignCenter, self.message)
+        painter.end()
+        return pixmap
 
     def rotate(self):
         """Rotate the spinner"""
-        self.angle = (self.angle + 10) % 360
-        self.update()
+        # 20 degrees per 100ms tick keeps the original rotation speed
+        self.angle = (self.angle + self._ANGLE_STEP) % 360
+        self.update(self._dots_rect)
 
     def set_message(self, message):
         """Update the message"""
         self.message = message
-        self.update()
+        self._text_pixmap = None
+        self.update(self._text_rect)
 
-    def closeEvent(self, event):
-        """Stop timer when closing"""
+    def set_cancel_callback(self, callback):
+        """Set a function called once if the dialog is closed while its operation runs
+
+        Closing with accept() doesn't call it; set None once the operation finishes.
+        """
+        self.cancel_callback = callback
+
+    def done(self, result):
+        """Stop timer and cancel the running operation when closing"""
+        # close(), Escape and reject() all end up here; accept() means it finished
         self.timer.stop()
-        super().closeEvent(event)
+        callback, self.cancel_callback = self.cancel_callback, None
+        if callback and result != QDialog.Accepted:
+            callback()
+        super().done(result)
 
 
 class MainWindow(QMainWindow):
     """Main application window with examples - Dark Theme"""
 
-    def __init__(self):
+    def __init__(self, use_asyncio=True):
         super().__init__()
+        # Without QtAsyncio there is no running asyncio loop, so operations go to the pool
+        self.use_asyncio = use_asyncio
         self.setWindowTitle("Loading Popup Examples - Dark Theme")
         self.setGeometry(100, 100, 400, 300)
 
@@ -197,6 +313,7 @@ class MainWindow(QMainWindow):
 
         self.result_label = QLabel("Results will appear here...")
         self.result_label.setWordWrap(True)
+        # All result states are styled up front and picked via the "status" property
         self.result_label.setStyleSheet("""
             QLabel {
                 padding: 10px;
@@ -205,6 +322,16 @@ class MainWindow(QMainWindow):
                 border-radius: 5px;
                 color: #ffffff;
             }
+            QLabel[status="success"] {
+                background-color: #1a3d1a;
+                border: 1px solid #2d5a2d;
+                color: #90ee90;
+            }
+            QLabel[status="error"] {
+                background-color: #3d1a1a;
+                border: 1px solid #5a2d2d;
+                color: #ff6b6b;
+            }
         """)
 
         layout.addWidget(btn1)
@@ -238,104 +365,104 @@ class MainWindow(QMainWindow):
             }
         """)
 
-    def long_running_operation(self):
+    async def long_running_operation(self):
         """Simulates a long-running operation"""
-        time.sleep(5)  # Simulate work
+        await asyncio.sleep(5)  # Simulate waiting on I/O
         return "Operation completed successfully! Result: 42"
 
-    def quick_operation(self):
+    async def quick_operation(self):
         """Simulates a quick operation"""
-        time.sleep(2)
+        await asyncio.sleep(2)
         return "Quick operation done!"
 
-    def error_operation(self):
+    async def error_operation(self):
         """Simulates an operation that raises an error"""
-        time.sleep(1)
+        await asyncio.sleep(1)
         raise ValueError("Something went wrong in the operation!")
 
+    async def _run_with_dialog(self, dialog, operation):
+        """Show dialog while awaiting operation on the Qt event loop, then close it"""
+        # The dialog is application modal, so show() blocks input without a nested event loop
+        dialog.show()
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            self.on_operation_error("Operation cancelled")
+        except Exception as e:
+            self.on_operation_error(str(e))
+        else:
+            self.on_operation_complete(result)
+        finally:
+            # Already done, so closing must not cancel this task
+            dialog.set_cancel_callback(None)
+            dialog.close()
+
+    def _start_operation(self, dialog, operation):
+        """Schedule operation as a task that closing the dialog cancels"""
+        if not self.use_asyncio:
+            self._start_in_pool(dialog, operation)
+            return
+        self._task = asyncio.ensure_future(self._run_with_dialog(dialog, operation))
+        dialog.set_cancel_callback(self._task.cancel)
+
+    def _start_in_pool(self, dialog, operation):
+        """Run operation's coroutine to completion on a pool thread (not cancellable)"""
+        self._runnable = WorkerRunnable(asyncio.run, operation())
+        self._runnable.signals.result.connect(self.on_operation_complete)
+        self._runnable.signals.error.connect(self.on_operation_error)
+        self._runnable.signals.finished.connect(dialog.close)
+        dialog.show()
+        QThreadPool.globalInstance().start(self._runnable)
+
     def run_with_progress_loading(self):
         """Run operation with progress bar loading dialog"""
-        # Create and show loading dialog
         self.loading_dialog = LoadingDialog(self, "Processing data...")
-
-        # Create worker thread
-        self.worker = Worker(self.long_running_operation)
-        self.worker.finished.connect(self.loading_dialog.close)
-        self.worker.result.connect(self.on_operation_complete)
-        self.worker.error.connect(self.on_operation_error)
-
-        # Start operation
-        self.worker.start()
-        self.loading_dialog.exec()
+        self._start_operation(self.loading_dialog, self.long_running_operation)
 
     def run_with_spinner_loading(self):
         """Run operation with spinner loading dialog"""
-        # Create and show spinner dialog
         self.spinner_dialog = SpinnerDialog(self, "Working on it...")
-
-        # Create worker thread
-        self.worker = Worker(self.long_running_operation)
-        self.worker.finished.connect(self.spinner_dialog.close)
-        self.worker.result.connect(self.on_operation_complete)
-        self.worker.error.connect(self.on_operation_error)
-
-        # Start operation
-        self.worker.start()
-        self.spinner_dialog.exec()
+        self._start_operation(self.spinner_dialog, self.long_running_operation)
 
     def run_quick_operation(self):
         """Run a quick operation"""
         self.loading_dialog = LoadingDialog(self, "Quick processing...")
-
-        self.worker = Worker(self.quick_operation)
-        self.worker.finished.connect(self.loading_dialog.close)
-        self.worker.result.connect(self.on_operation_complete)
-        self.worker.error.connect(self.on_operation_error)
-
-        self.worker.start()
-        self.loading_dialog.exec()
+        self._start_operation(self.loading_dialog, self.quick_operation)
 
     def run_with_error(self):
         """Run operation that will error"""
         self.loading_dialog = LoadingDialog(self, "Attempting operation...")
-
-        self.worker = Worker(self.error_operation)
-        self.worker.finished.connect(self.loading_dialog.close)
-        self.worker.result.connect(self.on_operation_complete)
-        self.worker.error.connect(self.on_operation_error)
-
-        self.worker.start()
-        self.loading_dialog.exec()
+        self._start_operation(self.loading_dialog, self.error_operation)
 
     def on_operation_complete(self, result):
         """Handle successful operation completion"""
         self.result_label.setText(f"Success: {result}")
-        self.result_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #1a3d1a;
-                border: 1px solid #2d5a2d;
-                border-radius: 5px;
-                color: #90ee90;
-            }
-        """)
+        self._set_result_status("success")
 
     def on_operation_error(self, error):
         """Handle operation error"""
         self.result_label.setText(f"Error: {error}")
-        self.result_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #3d1a1a;
-                border: 1px solid #5a2d2d;
-                border-radius: 5px;
-                color: #ff6b6b;
-            }
-        """)
+        self._set_result_status("error")
+
+    def _set_result_status(self, status):
+        """Restyle the result label from its stylesheet without reparsing it"""
+        self.result_label.setProperty("status", status)
+        self.result_label.style().unpolish(self.result_label)
+        self.result_label.style().polish(self.result_label)
 
 
 if __name__ == "__main__":
+    try:
+        from PySide6 import QtAsyncio
+    except (ImportError, SyntaxError):
+        # Some PySide6 releases (e.g. 6.8) ship a QtAsyncio that needs Python 3.12+
+        QtAsyncio = None
+
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(use_asyncio=QtAsyncio is not None)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    if QtAsyncio is not None:
+        # The demo operations are coroutines, so run Qt under the asyncio-integrated loop
+        QtAsyncio.run(handle_sigint=True)
+    else:
+        sys.exit(app.exec())
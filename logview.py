@@ -1,35 +1,125 @@
 import sys
+import re
 import logging
-from PySide6 import QtWidgets, QtCore
+import collections
+from PySide6 import QtWidgets, QtCore, QtGui
 
 logger = logging.getLogger(__name__)
 
+# Level names LogStream looks for in written text, and the color for each, in
+# priority order when a line mentions more than one
+_LEVEL_RE = re.compile(r"DEBUG|ERROR|WARNING")
+_LEVEL_COLORS = {"DEBUG": "blue", "ERROR": "red", "WARNING": "orange"}
+
+
+class _LogBatcher(QtCore.QObject):
+    """Collects log lines from any thread and appends them to the widget in one batch."""
+    _schedule = QtCore.Signal()
+
+    def __init__(self, log_widget, interval=33, maxlen=None):
+        super().__init__()
+        self.log_widget = log_widget
+        self._pending = collections.deque(maxlen=maxlen)
+        self._scheduled = False
+        self._formats = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+        # Queued when add() runs off the GUI thread, so the timer is always started on it
+        self._schedule.connect(self._start_timer)
+
+    def add(self, message, color):
+        self._pending.append((message, color))
+        if not self._scheduled:
+            self._scheduled = True
+            self._schedule.emit()
+
+    def _start_timer(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _format(self, color):
+        """Return the QTextCharFormat for color, building it on first use."""
+        text_format = self._formats.get(color)
+        if text_format is None:
+            text_format = QtGui.QTextCharFormat()
+            text_format.setForeground(QtGui.QColor(color))
+            self._formats[color] = text_format
+        return text_format
+
+    def flush(self):
+        """Append every pending line as its own block, bypassing the HTML parser."""
+        self._scheduled = False
+        if not self._pending:
+            return
+        try:
+            # Widget signals (textChanged, ...) fire once for the batch instead of per line.
+            # The document is left unblocked since it drives the view's layout and repaint.
+            with QtCore.QSignalBlocker(self.log_widget):
+                cursor = QtGui.QTextCursor(self.log_widget.document())
+                cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+                cursor.beginEditBlock()
+                while self._pending:
+                    message, color = self._pending.popleft()
+                    cursor.insertBlock()
+                    cursor.insertText(message.rstrip("\r\n"), self._format(color))
+                cursor.endEditBlock()
+            self.log_widget.textChanged.emit()
+        except RuntimeError:
+            # Fail silently if widget is being destroyed
+            pass
+
+class _SaveLogRunnable(QtCore.QRunnable):
+    """Writes a snapshot of log lines to a file on the thread pool."""
+
+    def __init__(self, file_name, lines):
+        super().__init__()
+        self.file_name = file_name
+        self.lines = lines
+
+    def run(self):
+        try:
+            with open(self.file_name, "w") as file:
+                for line in self.lines:
+                    file.write(line)
+                    file.write("\n")
+        except OSError as e:
+            logger.error(f"Could not save log to {self.file_name}: {e}")
+
 class LogStream(QtCore.QObject):
     """A custom stream to redirect stdout or stderr to a widget."""
     signal_error = QtCore.Signal()
+    _error_seen = QtCore.Signal()
     def __init__(self, log_widget, color="black"):
         super().__init__()
         self.log_widget = log_widget
         self.color = color
+        # Lines are coalesced and written to the widget at most ~30 times a second
+        self._batcher = _LogBatcher(log_widget)
+        # A burst of error lines (e.g. a traceback) emits signal_error once
+        self._error_pending = False
+        self._error_timer = QtCore.QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(100)
+        self._error_timer.timeout.connect(self._emit_error)
+        # Queued when write() runs off the GUI thread, so the timer is always started on it
+        self._error_seen.connect(self._error_timer.start)
 
     def write(self, message):
         if message.strip():  # Ignore empty messages
-            # Check if debug mode is enabled
-            app = QtWidgets.QApplication.instance()
-            cursor = self.log_widget.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            if "DEBUG" in message:
-                self.color = "blue"
-            elif "ERROR" in message:
-                self.color = "red"
-                self.signal_error.emit()
-            elif "WARNING" in message:
-                self.color = "orange"
-            else:
-                self.color = "white"
-            # self.textEdit.insertHtml(html)
-            self.log_widget.insertHtml(
-                f'<br><span style="color:{self.color}">{message}</span></br>')
+            # One scan for the level names instead of a substring test per level
+            found = set(_LEVEL_RE.findall(message))
+            level = next((name for name in _LEVEL_COLORS if name in found), None)
+            self.color = _LEVEL_COLORS.get(level, "white")
+            if level == "ERROR" and not self._error_pending:
+                self._error_pending = True
+                self._error_seen.emit()
+            self._batcher.add(message, self.color)
+
+    def _emit_error(self):
+        self._error_pending = False
+        self.signal_error.emit()
 
     def flush(self):
         pass  # Flush is required by sys but can remain empty here
@@ -51,19 +141,15 @@ class QtLogHandler(logging.Handler, QtCore.QObject):
         self.console_stdout = sys.__stdout__
         self.console_stderr = sys.__stderr__
 
-        # Connect signal to slot for thread-safe GUI updates
+        # Bounded so a burst of records can't grow memory without limit before a flush
+        self._batcher = _LogBatcher(log_widget, maxlen=5000)
+
+        # Kept for callers that emit it directly; emit() feeds the batcher itself
         self.log_message_signal.connect(self._append_to_widget, QtCore.Qt.QueuedConnection)
 
     def _append_to_widget(self, msg, color):
-        """Slot to append message to widget (runs on main thread)."""
-        try:
-            cursor = self.log_widget.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            self.log_widget.insertHtml(
-                f'<br><span style="color:{color}">{msg}</span></br>')
-        except Exception as e:
-            # Fail silently if widget is being destroyed
-            pass
+        """Queue message for the widget (callable from any thread)."""
+        self._batcher.add(msg, color)
 
     def emit(self, record):
         try:
@@ -72,10 +158,12 @@ class QtLogHandler(logging.Handler, QtCore.QObject):
 
             # Output to console if running from terminal
             if self.also_log_to_console:
-                if record.levelno >= logging.ERROR:
-                    print(msg, file=self.console_stderr)
-                else:
-                    print(msg, file=self.console_stdout)
+                stream = self.console_stderr if record.levelno >= logging.ERROR else self.console_stdout
+                # One write per record, flushed only when it matters (None under pythonw)
+                if stream is not None:
+                    stream.write(msg + "\n")
+                    if record.levelno >= logging.CRITICAL:
+                        stream.flush()
 
             # Map logging levels to colors
             level_colors = {
@@ -87,12 +175,19 @@ class QtLogHandler(logging.Handler, QtCore.QObject):
             }
             color = level_colors.get(record.levelno, "white")
 
-            # Emit signal to update GUI on main thread
-            self.log_message_signal.emit(msg, color)
+            # Safe from any thread: the batcher queues on a deque and posts one event per batch
+            self._append_to_widget(msg, color)
 
         except Exception:
             self.handleError(record)
 
+    def close(self):
+        """Flush console output still sitting in the stdio buffers."""
+        for stream in (self.console_stdout, self.console_stderr):
+            if stream is not None:
+                stream.flush()
+        super().close()
+
 
 class LogWindow(QtWidgets.QDialog):
 
@@ -109,6 +204,8 @@ class LogWindow(QtWidgets.QDialog):
         self.log_text_edit = QtWidgets.QTextEdit(self)
         self.log_text_edit.setStyleSheet("background-color: black;")
         self.log_text_edit.setReadOnly(True)
+        # Keep only the most recent lines so long sessions don't grow memory without bound
+        self.log_text_edit.document().setMaximumBlockCount(5000)
         # Disable word wrap
         self.log_text_edit.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
         layout.addWidget(self.log_text_edit)
@@ -206,8 +303,13 @@ class LogWindow(QtWidgets.QDialog):
         """Save the log to a text file."""
         file_name, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Log", "", "Text Files (*.txt)")
         if file_name:
-            with open(file_name, "w") as file:
-                file.write(self.log_text_edit.toPlainText())
+            # Snapshot the lines here (QTextDocument is not thread safe) and write off the GUI thread
+            lines = []
+            block = self.log_text_edit.document().begin()
+            while block.isValid():
+                lines.append(block.text())
+                block = block.next()
+            QtCore.QThreadPool.globalInstance().start(_SaveLogRunnable(file_name, lines))
 
     def show(self):
         self.signal_clear.emit()
@@ -0,0 +1,646 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x0b\xc0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x01{iCCPICC Prof\
+ile\x00\x00x\x9cu\x91\xcbKBA\x14\x87\xbf\
+\xb4(\xcaP\xd0\x85\x8b\x16\x12\xd6*\xc3\x0a\xa46A\
+FX !f\x90\xd5Fo>\x02\x1f\x97{\x95\x90\
+\xb6A\xdb\xa0 j\xd3kQ\x7fAm\x83\xd6AP\
+\x14A\xb4\xaemQ\x9b\x92\xdb\xb9\x19\x18\x91g8s\
+\xbe\xf9\xcd\x9c\xc3\xcc\x19\xb0\xc4rJ^o\xf6C\xbe\
+P\xd2\xa2\xa1\xa0g.>\xefi}\xc6\x82\x1b'.\
+\x1c\x09EW\xc7\x22\x910\x0d\xed\xfd\x96&3^\xfb\
+\xccZ\x8d\xcf\xfdk\x1dK)]\x81\xa66\xe1QE\
+\xd5J\xc2\x93\xc2\xe1\x95\x92j\xf2\x96\xb0K\xc9&\x96\
+\x84O\x84\xfb4\xb9\xa0\xf0\x8d\xa9'k\xfcdr\xa6\
+\xc6\x9f&k\xb1\xe88X\x1c\xc2\x9e\xcc/N\xfeb\
+%\xab\xe5\x85\xe5\xe5x\xf3\xb9\xb2\xf2s\x1f\xf3%\xb6\
+TavFb\xb7x\x17:QB\x04\xf10\xc5\x04\
+\xe3\x04\x18`D\xe6\x00>\x06\xe9\x97\x15\x0d\xf2\xfd\xdf\
+\xf9\xd3\x14%W\x91Y\xa5\x82\xc62\x19\xb2\x94\xe8\x13\
+\xb5,\xd5S\x12\xd3\xa2\xa7d\xe4\xa8\x98\xfd\xff\xdbW\
+==4X\xabn\x0bB\xcb\xa3a\xbc\xf6@\xeb&\
+T7\x0c\xe3\xe3\xc00\xaa\x87`}\x80\xf3B=\xbf\
+\xb8\x0f\xc3o\xa2o\xd45\xef\x1e\xd8\xd7\xe0\xf4\xa2\xae\
+%\xb7\xe1l\x1d\xdc\xf7jBK|KVqK:\
+\x0d/\xc7\xd0\x19\x07\xe7\x15\xb4/\xd4z\xf6\xb3\xcf\xd1\
+\x1d\xc4V\xe5\xab.ag\x17z\xe5\xbc}\xf1\x0b0\
+\xecg\xcd\xf2\x93\x9d@\x00\x00\x0a\x00IDATx\
+\xda\xed\x9b{\x8c\x5cU\x1d\xc7?\xe7\xde;\xedn-\
+[\x96\xdd\xee\xf2\xd8\x96*J\xd7-\x8f\x05lQS\
+\x8bOJE\xa4\xca#E \xf1\x190\x82H!\x02\
+A]4\xd1\x10P#\xcf\xc4`\x8c\x90\x9a\xca\xbb\x05\
+\x09\x82P\xe5!\x0d(6\xa5\xb5jX\xa0\xb5\xb4\xfb\
+\x9e}Lg\x1fsg\xee\xcf?\xe6w\x9a\xe3ev\
+\xa7;;\xdb\x1d\x84\x93\xdc\x9c\xd9;\xf7\x9e9\xbf\xd7\
+\xf7\xf7=\xbfs\x16\xdem%5\x03\xf8\xef\xaa\xe1\x1d\
+jy\x80\xc3\x80\xef\x035\xb1\xfb\xff\xf7\xcd\xba\xfd/\
+\x01\x01>\x11\xbb\xff\xb6k\xde$\x9f\x17\xed\xdf\x0f\xe4\
+\x80\x0f\xbf\xdd=\xc0+\xf1\xbd\xacZ\xfd\xf8\x98b\xa6\
+{\xaee\xf7\xb4`\x8a\xa1p\xacZ?w\x10\x84\x8f\
+\x1co\x93\x99\xf6\x00\xab\x80c\x80\x86)\x8eu F\
+\x8a\x80V\xe04\x15\xde\x9b\xa9\x90\xb1\xb1\xfeg\x9d\x88\
+\x00\x9f\x9eF \xb4\x1ez\x060\x00\x8c\x01\x0b\xca\xa9\
+po\x8a\x8a`\x1a\x810P\xacY\x03<\x0a\xcc\x03\
+^\x00zc!1#\x1e\xf0\xac\xe3\x01\x1b\xa6\xc1\x03\
+\xac\xe5\xbf\xa2\xbf\x11\x01\x19\xe0\xc4\x99N\xbbV\x01\xcf\
+9\x0a\xf8G\x99c2\xa1\xfd\xc5:~F\xfbu\x95\
+\xc09\xac\x02\x9ew\x140\x084\x96)\x0c\xac\xf0\x17\
+\xa8\xd5\xb3z\x8d\x02\x1f\xd0\xf1\xbdJP\xc0f\x15>\
+\xd4\xfe\xd42X\xc7\xba\xfd\x1aM\xab9\xc7\xfawT\
+\x1a\xe3|I'6\xa6\xfd\x97\xa7\xc8+\xec{\x17\xaa\
+\xe5sj\xf9H=\xec\xa8\xe9\xb2\xbeW\xa6\xf7\x8e\x9b\
+\xa2\xdbg\x81\x8b4\xce\xc5!;\x06\xb8\x13\xd83\x93\
+\xc8_\xa8m\x8d\x01\xd4\x1fJT\xa8\xb5\xfc\x17\x1c\xb7\
+\xcf\xa9\xa0\x11\xd0\x03\xd4WB\xec\xbb\xf1\x9f\x00^W\
+\xc1\xb3\xdawi\x9e\xf6U(\xff\x00\x00\xd1%9c\
+\x8e\xeb\xbb\xd8r\xe3\x14CkZ\x140\x0f\xe8\x06\xc4\
+\x18\x93\xf3<\xcfNz\xd9\x04\x82\xfa1\x0bZ\xb4\xff\
+\x0c0\xac\xef\xe7\x9c\xccb\xf3\xfe\xe2J\xb1>\xceD\
+\xe6\xfb\xbe?\xe4y\x9e\x9dh\xd6\x18#\xbe\xef\xaf\x03\
+\xce\x05V\x03\x1fq\xd6\x08\xf11\xac\xf0+\x81t\x01\
+\xe1\xad\xf57V\x1a\xf2\x07\xc6\x18\xaa\xaa\xaa\x96[\x84\
+nll\x8c\x9a\x9a\x16\xd8\x89\x8b*\xc5^\x03\xc0\xdf\
+\x15\xc4\xce\x07\x8ev\xc6\xfa\xaa#\xa8+\xbc\xfb\xf7\xf2\
+JR\x80g\x8c\xc1\xf7\xfd\x95@\xdf\x19+WE\x1b\
+\x1e\xda\x18\xedzc\xb7\xec\xd9\xdd!O<\xfe\xa4\xb4\
+\x9e\xd8\x9a\x03\xb2\x9e\xe7\xd9\xf4%\xb1kX)\xf4\xfa\
+\x02\xc2\x8a\x83)\x11\xf0\xcc4\xaf0'/|\x22\x91\
+8\xc1\xf3\xbc\xf4\xcfn\xfe\xb9\x88H$\x222\x92\x1e\
+\x93\xd4`Z\xb2\x99H:;\xbaeI\xcb\x12\xd7\x13\
+,\xa8\x85\x9e\xe7e\x83 \x10\xe7\x8a|\xdf\x8f\x8c1\
+R@\x01\x02\x9cY1\xe0\xd7\xd6\xd6\xe6\xb5\xb5\xb5\x05\
+\xb3gW\xbd\xb4\xee\x9e\xdf\x8a\x88\x84\xbbw\xed\x91\xd5\
+g\xaf\x96\xd3V\x9c&;\xdf\xf8\x8f\xf4v'%\x17\
+\x8a\xdc\xfb\xbb\xfb\xdf\x12\x0a\xceg\x97\xda\x16\xfa\xde\xde\
+\x7fF-_\x11\xd6\xf7\x83 \x008\xfb\xeb_\xfb\x86\
+\x88Hvt8#k\xaf\xbcj\xbf\x00\x97}\xebr\
+\xc9\x85\x22\xc9\xde\x01y\xbd}\xa7\xd4\xd4\xcc\x13\xcd\x10\
+b-\xbcp\xe1\xd1\xb2f\xcd\x05r\xcdw\xaf\x95\xeb\
+\xae\xbd^.\xbf\xec\xdb\xb2j\xd5ge\xee\xdc\xb9V\
+\x09.\xfb;\xa1\x92\xdc\xdf\xf7<\x0f\xe0\xe1\x87\x1e\xdc\
+\x10\x8d\x8d\x84af4'g\x7f~\xf5~\x05\x5ct\
+\xe1\xc52\x92\xce\xc8\xd0\xc0>\xd9\xba\xe5\x15\xa9\xae\xaa\
+\x16\xcd\x0a\x02\xc8w\xae\xb8R\xfaz\x92\x92\xcdD\x12\
+\x8e\xe5Dr\xf9\x00\xcaf\x22\xd9\xf2\xf2VY\xbcx\
+\xb1(v\x08pE%\x01\x9f\x01\xa8\xab\xab;\x04\xe8\
+|\xec\xf7\x8f\xcb\xc8p&J\x0d\xa6\xe5\xc5\xcd\x7f\x95\
+S\x97\x9d*\x97\x5cr\xa9\xf4\xf7\x0dJOW\x9fH\
+N\xe4\xe6\x9b~*\x80$\x12\x09\x01\xe4\xdak\xae\x13\
+\x91\xbcw\xf4v'%3\x92\x95\xae\x8e\x1e\xd9\xf5\xc6\
+n\xe9\xed\xce+e\xeb\x96m\xd9\xfa\xfaz1\xc6\xdc\
+a\x8c\xa9\x18\xd2\xb3\xdf\x05\xe7\xcf\x9f\xdf\x0aD\xb7\xfe\
+\xe26\xc9\x85\x91t\xee\xed\x96tjDR\x83\xc32\
+6\x12J\xb2w@\xfa\xfb\x06\xa5\xbb\xb3W\x16-Z\
+\xb4\xdf\xf5\x17.<Z\xfaz\xfa\xa5\xbfoPz\xbb\
+\x93\xd2\xdb\x9d\x94\xb6\x1f\xdc ---\xd2tT\x93\
+\xdc\x7f\xef\x03\xb2ohXD$\xbc\xf0K\x17\x09p\
+\xa9\x88\x98\x83\xad\x00\xaf\x98\x07\xa4\xd3\xe9\xc3\x01\xb3\xe1\
+\x91\x0d9/0\xcc\x9a5\x8bT*\xc5\xf0p\x9ad\
+2\x89\x88phm\x0dW_\xbd\x96\x9d;w\x92H\
+$\x10\x11N9\xf9\x14j\x0e\xa9!\x93\xc9P]]\
+\xcd\xde\x8e\xbd\xfc\xf0G7\xb0c\xc7\x0e\xde\xdc\xf3&\
+\xcf=\xf7,\xd5U\xd5DYhjj\x02\xa8Q\xcf\
+\xa1\xa2\x140<<<\xcf\x18\xc3\xa6MO\xf3\x93\x1f\
+\xdf\x88\xef\xfb4\xcc\x9fOCC=\x0d\x0d\x0d$\x12\
+\x09\xd6\xae\xbd\x8a{\xd6\xdd\x83\xef\xfb\xe4r\xf9\x0a\xb9\
+\x88 \x08\x9e\xe7\x11\x86!\xf5u\xf5\x1cy\xc4\x11\xfb\
+\x07_\xbat\x19\x990\x83\xe7A]]\x1d\xba\xec-\
+%L\xfd\xd85)\xf0\x9c\xc8\xdd\xac5^\x13\x111\
+\xc6\x98\xeb\xbfw\x1d\xbf\xb9\xfb\xd7|l\xf9\x0a\x1a\x1a\
+\x1bH\xf6%\xd9\xf4\xa7M\xb4\xb7\xbf\x8a\xe7y\xe4r\
+9\x144\xd9\xb6}\x1b\xfb\xf6\xed\xc3\xf3|\xc20\xa4\
+\xb6\xb6\x96[o\xb9\x9d;\xee\xbc\x9d\xcf\x9dy\x16\xe7\
+\x9e{\x1eCCCT\xcd\xa9\xf7\xc20\x04x3\xf6\
+\xbb\xc5(\xb9\xcb5\xc63nT.\x0f\xd9\xa8\xe9*\
+,\xc0\xf0\xe2\x14x\xff\xdf\xca\x1b\xa4cO\x97\xf4v\
+'e$=&\xa3\xc3\x19\xc9\x8cf%\xd9; =\
+]}26\x12\xca\xca\xd3\xcf\xc8\x02-\xbe\xef\x17\xf3\
+\xca\xf8wu\xba\xeeXI~\x9fr9\xf0\xbeq\xaa\
+\xd7%+\xc0hE\xa6S\x85\xfb\x1fV\x17\x17\xde*\
+\xc0\x18#G\x1ey\x94\xbc\xb2u\xbb\x88\x88\xa4\x06\xd3\
+\xd2\xd3\xd5'\x9d{\xbb\xa5so\xb7t\xec\xe9\x12\xc9\
+Jv\xe3\x86G#`\xdb}\xf7\xddWl\x09\xed;\
+sZ\x03<fW\xa5\x05(\xf7\x8b\xaa\x98\xb2\xf0\x09\
+;\xc02\xa0/V\x08\x19\xf7\xb2$\xa8\xb1\xb1Qn\
+\xbd\xe56\xd9\xfe\xca\x0e\x19\xecOI.\x14\xc9\x85\x22\
+\x22\x22\xbd\xdd}ass\xb3\x18cn\xd2\xd0\x09\x8a\
+\xcc\xe1\xe3N9\xcee\x90\xa1\xf6\xee\xdab'0G\
+\x95j\x8a\xad\xf1\x8b\x12\x22\x1d\xfc$\xe0~\xf2[b\
+\xb6j3\xae\xe5\x8c1\x88\xe4Cz\xce\x9c9,^\
+\xdc\xcc\xc9'\x9dDs\xf3\x07\xa9\xab\xab\x8b\xee\xfa\xd5\
+]\xb2y\xf3\x0b\xd9\x9a\x9a\x9a\xe3\x86\x86\x86\xda\xc7\x89\
+[{o-p\x93\xfe^\x18\xab+\xc4\xb1\xcbn\x9f\
+-\x01v\x94\x0b\x0f\xac\x0b6\x00w\x17\xb0Bv<\
+O\xb0\xac\xb0\xc0\xaaO<\xcf\xbbf\x02\xf6\xe7;\x85\
+\x13\x0bz.\x0e\xa5\x81\x0e`\xb7S[p+K\x9f\
+,7\xb3t\xe3\xe9\xa3\xc0]\x16\x1b\x0a\x5c\xee\xe2'\
+4\xc6\x84\x9e\xe7\x85A\x10DA\x10H\xe0\x07cA\
+\x10\x5c5\xc1\x04-\xda\xcf\x06\xb69U\x22\x01\xda\x81\
+\xf3\x80\x85@-\xf0\x1e\xe0\xe1\x02\xc68k:\xa8u\
+\xbcDu\x18p\x0e\xf0\x10\x90rBC&P\xccF\
+\xe0\xe4\x22 e\xf1\xe0<\xa7Rd\xf7\x0aN)\xf0\
+\xfcc\xa5(\xa0\x14\xdai\x05\xb1\x83&\x81\x07\xf5\xfa\
+\x97\xd6\xf1\x22\xbd\xff\x17\x150\xab\x15\xa2v\xe0\x09\xe0\
+o1l)\xd4l\xcc~\xd3)\x9e\x04\xeau/\x03\
+\xb3t\x5c\xa3\xcf\xce)\xe0\xa9\x83\x1c\x84\x16\xe8\xb5*\
+\x96!6\x17\x09\xa5\x03\xc9\xf7K\x1ct\x8f\xb4z\x1c\
+\xdf\x22\xb3\xfd\xd3\xea%\xa3\xda\x0f(O\x98\x10\xec\xcb\
+\xb1\xf0\xb0.\x7fE\x8c\xc9\xd5\x03U:\x19S\xe0\xf9\
+bX\x13i\xbe\xf7U\xa8*\xe0\x8f\xc0\xab\xbc\xf5\xc4\
+\x08\x1a~\x81#\xd3zM\xdb\x13y\x19\xe5\xc8\x0c\x86\
+\xfc\x19\x81\xc8\xd9\xd8\x10%)\x87\x96\xc0\xc8l\xde\xae\
+\x02^\x8by\xd5\x17\xf5\xbb\xa0\x80\xb7\xb4\xea\xce\xd2#\
+\xba\x9fPW\x8c\x03\x94K\x01\x90?#`\x81\xca\x02\
+\xe0\x08\xd0T\x82\x02\x0a\x81\x9f\x90?\x18Q[.\x8a\
+[N\xe1O\x8c\xb1\xb0\xc8\xe9\x8f/\x81\x8e\xdag\x9f\
+\xd11F\xb5\x7f\xa0\x08\xa2{\xce\x8a08\x18J\xb2\
+\x13Y\x17\xb3\x94\xab\x84\x15\x93\xcc\xc3\xf6\xb9\xa5\x0e\xf0\
+\xd9q/.\xe0\xfe3[-\x22\x7f`r\xb4@\xee\
+\xb7yx\xf5$\x15`\x85\xbb-\x16\xfb)\xe0\x88\xe9\
+(\x96Nu{\xfc\x1cej\xb9\x98\xcb\xd9Lp\xf8\
+$b\xd6\xa8\xe2fkJu\xdb\xf3Jy\xcb\xbeE\
+^\xaa\x02lZY]D\xc0\x05\x93-\xc2j\x9e\x7f\
+o\xec\xdez*\xe8\x80\x84\xad\xc6,\x01>\x14c\x85\
+\xe3)@&1\x97V\xfd\x1cjH\xf4;47W\
+)\x0a@A)\x18gR\xd6rM\x93P\x80}o\
+i\x8c\x0a\xbf\xa8\x84\xc6c\x1a\xce$\x97\x82\xa8Y%\
+)k&P\xa2q0\xc0w0B\x0a<\xe39\x84\
+E\x1c\x05\xd8\xf6\x94\xe3\xfe3~D\xc6\xba\xfa\xe9\x14\
+\xde\xdd\x8d\xa7\xc1\x1e%/\xc6\xa1\xa9A\x91\x90I\xc5\
+Xe\xebt\xa0\xffT\xd7\x02\xe7;\x82N4\xb1Z\
+\xa5\xa4\xfd\xea9q/i\x00\x16\x91?u\xde\xa2\xa0\
+:W\x05\xf7\x94\xf7o\x8f\x85\xc4\x8c)\xc0\x1e\x8b\x9f\
+\x05|\xaa\x08*\x1b\x07\x1c\x17\xe8\xb2\xf4X\xe5\x0d\xcd\
+*\xec1\xfa]M\x81\x0cc\xd3\xe1z\xfd\x1c\x14P\
+\xe0\x8c\x91\x9f\xe6\x18\xeb+v\xedU\x0f\x18\xef{w\
+\x09\xeb\xdeO\x92?U2\xadg\x84&\xeb\x016M\
+Y\xf4?\x10\x86g\x19\x9c](\xb9\xbb9n=A\
+t\xf5\xf7*\xf9S\xe1\xeb\x81]N\xc1\xa3b\x14\xb0\
+(V\x11.V=\xcaj\xf56^\xc1Miz\xfb\
+\xa7\x22\xfdS\xc0\xbf\xb5\xe8\x11\x0f%*A\x01\xe2\xe4\
+e/\x96\x05\x0a)Jt\xfc\x84r\xfa'\x81M\xe4\
+\x0fYv(.$\xd5\xfd\x0bU\x8b\x22*\xe8dh\
+\x1c\x07n?\xc0\xf8\xcf\x91/\xa1\xb7\x14\x193p\xf8\
+\xc0Am\xa6\x84\xe7\xad\xc5W(\xd3kP\xc23O\
+S\xd8\x5c\xb5z\xbb\x0a\xbf%V=\x12g\x0c\xe1\xe0\
+\xfc\xc7\xd9\x8c*\xaeb\x0e<\x95\xc3\x03\x0a\xd5\x03\xc7\
+\xc3\x0aS\xa9q\xfcns\xda\x7f\x01O\xdc\xa0jW\
+\x22\xf2\xb8\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x19\xa9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x01{iCCPICC Prof\
+ile\x00\x00x\x9cu\x91\xcbKBA\x14\x87\xbf\
+\xb4(\xcaP\xd0\x85\x8b\x16\x12\xd6*\xc3\x0a\xa46A\
+FX !f\x90\xd5Fo>\x02\x1f\x97{\x95\x90\
+\xb6A\xdb\xa0 j\xd3kQ\x7fAm\x83\xd6AP\
+\x14A\xb4\xaemQ\x9b\x92\xdb\xb9\x19\x18\x91g8s\
+\xbe\xf9\xcd\x9c\xc3\xcc\x19\xb0\xc4rJ^o\xf6C\xbe\
+P\xd2\xa2\xa1\xa0g.>\xefi}\xc6\x82\x1b'.\
+\x1c\x09EW\xc7\x22\x910\x0d\xed\xfd\x96&3^\xfb\
+\xccZ\x8d\xcf\xfdk\x1dK)]\x81\xa66\xe1QE\
+\xd5J\xc2\x93\xc2\xe1\x95\x92j\xf2\x96\xb0K\xc9&\x96\
+\x84O\x84\xfb4\xb9\xa0\xf0\x8d\xa9'k\xfcdr\xa6\
+\xc6\x9f&k\xb1\xe88X\x1c\xc2\x9e\xcc/N\xfeb\
+%\xab\xe5\x85\xe5\xe5x\xf3\xb9\xb2\xf2s\x1f\xf3%\xb6\
+TavFb\xb7x\x17:QB\x04\xf10\xc5\x04\
+\xe3\x04\x18`D\xe6\x00>\x06\xe9\x97\x15\x0d\xf2\xfd\xdf\
+\xf9\xd3\x14%W\x91Y\xa5\x82\xc62\x19\xb2\x94\xe8\x13\
+\xb5,\xd5S\x12\xd3\xa2\xa7d\xe4\xa8\x98\xfd\xff\xdbW\
+==4X\xabn\x0bB\xcb\xa3a\xbc\xf6@\xeb&\
+T7\x0c\xe3\xe3\xc00\xaa\x87`}\x80\xf3B=\xbf\
+\xb8\x0f\xc3o\xa2o\xd45\xef\x1e\xd8\xd7\xe0\xf4\xa2\xae\
+%\xb7\xe1l\x1d\xdc\xf7jBK|KVqK:\
+\x0d/\xc7\xd0\x19\x07\xe7\x15\xb4/\xd4z\xf6\xb3\xcf\xd1\
+\x1d\xc4V\xe5\xab.ag\x17z\xe5\xbc}\xf1\x0b0\
+\xecg\xcd\xf2\x93\x9d@\x00\x00\x17\xe9IDATx\
+\xda\xed\x9dy\x9c\x5cU\x95\xc7\xbfo\xa9\xee\xf4R\xe9\
+\xce\xd6\x09\x90 [@B \x0b\xa0@\x08n\x83\x02\
+N\x10AP>\x22K\x047\x06!\x06\xd1\x19\xe5\xe3\
+\xe8Gpp\x06\x95\x00\x03\xce\xb8\x00\x82\xa2\x08\xc8\x92\
+\x04\x03&\xcc\x8cl!\x10F\x12I\x948$\x10H\
+\xba\xbbz\xaf\xee\xae\xe5\xbd3\x7f\xbc{\xab_W\xd7\
+\xd6\xddU\xd5]\xdd\xef~>\xef\xd3[U\xd7{\xf7\
+\xfc\xce\xef,\xf7\xdcs!\x18\xc1\x08F0\x82\x11\x8c\
+`\x04\xa3<\xc3\x00\xac`\x1a&\xe70\xd3\x80\x10\x8c\
+I(\xfci\xc0\xfb\x82\xe9\x98|\xb4\x0fp2\xb0\x03\
+\xe8\x01fg`\x85`LP\xe1\x1b\xc0!@3 \
+\xea\xbaL\xfd=\xf0\x07\xc6\x89M.\xd5\xb0\x94\xc0\xcf\
+\x02f\x01}\xea\xe73\x82\xe9\x9f\x1c\x00\x10\xf5\xb5I\
+}o)F8\x0a\xa8\x06\x9c\xc0!\x9c\xd8\x00\xc8d\
+\x0e\x00\x0e\x07\xe6\x06\x11\xc1\xe4\x01\x80\xe1\xfb\xea\x02\xf5\
+\xc0\xc1\x01\x00&\x1f\x00\xfcfaA \x82\xc9\x09\x00\
+=\x8e\x9d\x04\xa1o\x00\x80\x1c\x13\xf2\xee4F\x98H\
+a\xafT\x02\x08\xc6\x0a\x00\xfa\xfbw\xe1e\x06\xdd\x09\
+\xe2\x07\x98\x0c\xe49j*\x01\x04c\x05\x00=Q\xf3\
+\x80#\xc6(\x22)\xc5\x5c\xba\xea\xfb\x1f\x00\xcf\x02\xd3\
+\xd5s\x9a\x01\x00\x86j\x82\xabr\x02\x8b'\x80\xe6[\
+\xeay\xa6\x03\x0f\x01\xab\xd4s\xdd\x0f\xcc\x18\xcf>\xc1\
+X\xfb\x00\x00\xa7V\xb8\xf0m\xbcd\xd6\xd1\xc0\xd3\xc0\
+\xc7\x81\xa4\xbaN\x07>\xac\xc01i\xd7<t\xae\xff\
+&E\x87\x09\xf55\xa9\xbe\xfe\xaf\x9aD\xa3\x02\xfd\x00\
+[}]\x02\xec\xf1=\x9f~\xb6\xcd@\xddd\xcfs\
+h\x00|?\x0d\x00\xae\xfa\xdaU\xa1~\x80\x16\xfer\
+\x06\x16\xb9\xb4\xe0\x1d\xf5\x9c\xcb\xd2\xe6`R\x9b\x80L\
+&\xc1\x01\xc2\x8a>\xa9 M\xb1\x95\xb0?\x02<\x8e\
+\xb7\xc8\xe5(A;j^\x7f\x0e<\xe3\xfb]\xe0\x04\
+\xe6\xf8\xdb\xc2\x0a\xd3|m\xdf\x7f\x0bL\xf59\xb4\xda\
+\xd6w\x037\xf8\xf2\x01A\x18\x98\x07\x00\xc7T\x98\xf0\
+?\xa8\x84_\x9f\xe6\xe0\xe9\xb8\xffN`wZh8\
+\xe9}\x80\x9b\xd3|\x00\xbf\xcd|\xb1\x02L\x80\xb6\xf9\
+\xef\x03\xda}\xb6^|>\x8d\x0b\xb4\x02s\xd4\xb3\x8c\
+{\x9f\xc6\x1c\xe3\xcf\xd2\x02\x9f\xa3\xe2\xe5\xf1\x9a9\xd3\
+\x9a\xbfL\xc5\xf9\x8d\x19B;\x9d\xcd\xbc\x05\xd8\x17h\
+\xffP\xc1\xaf\xc9\xc0\x00:\x12\x88\xabPj<F\x02\
+Z\xf3O\x06Z2h\xbe\xfe\xd9\x05\xde\xc4KmW\
+LH[\xce\xc9\xb62\xd0\xbc\xa14+\x84\xb7.0\
+\xde\xcc\x80\xd6\xfc\xf7\x00\xbf\x03ffI\xeah\xe6\xfa\
+We\x1eL*d\x81k,\x00\x90m\x1c=Ni\
+\xff\xbd\xc0\xa3x%mN\x869\xd3\x11\xc0_\x81\x9f\
+0P\xf0B\x00\x80\xccT\x9a\xcd\x0f8\xce\xa7M\xe3\
+\xc9\xe6?\x8eW\xc2\xee\xe4\x01\xf1\x0d@o%i\x7f\
+\xb9A\xf6\xf34\xcf_\xd2\xec\xe9+\xe3\xc4vj\xa0\
+\x9e\x06\xb4e\xb9\xe7\xf4(\xe6ee\xc6\x82=\x0e9\
+\x00pO\x1e\x00\xec\x03\x0e\x18c?@\x0b\xff\x03@\
+g\x1e\xe1\xfb\xef\xfd\xdc\x02\xcd\xdc\xa4\x06\xc0/\xb3L\
+\xa8\x8e\x9f\x1d\xe5i\x8f\xd5Dj\xe1/\x1b\xa6\xf0u\
+\xba\xd7\xacd\xe1\x8c\xa5\x13h\xf8\x9c\xab\xc3\xc6\x88\x01\
+,%\xec%\xc0\xc3x\xe9\xdd\x5c6\xdfo\xe3\xbfK\
+\x05\xefm(\xe7\xc6\x90\xda\x1c\xaf\xd1\x93w\x82\xcf\xb3\
+.\xa7\xf0\x1d\xbc\xfa\xc4G\x19\xbc\xb0\x93m\xe8P\xf0\
+\x0f\xc0\x13>\x10\x07#\x87p\x9f\xc9\x92D\xf1\xff\xee\
+\xa52;\x82Z\xc8\x87\xa80.\x1f\xed\xfbM\x96\x8b\
+\xb7\x1a\x18\xd8\xfe\x02\xc7\x9fs\x00@g\x04;}f\
+\xc0,\x93\xf0\xe7\x02\xaf\x16(|\xff\xfd\xffIy\xfe\
+\x15]\xeca\x96I\xfbm\xbc\x953\xf2\xf8\x01S\x81\
+\xe3)\xfdB\x8a\xa6\xfd\x03\x81\xb5x\xcb\xd1N\x81\x9a\
+\xacM\xda\xddxi\xed \xf4+\x00\x00\xd3U\x98\xe7\
+\xd7\xf6\xf4K\xaf\x11\xfcH\xbd\xcfV\x93k\xa9\xefm\
+\x9f\xb7=\x1a3\xa1\x85<\x07\xd8:\x0c\xcd\xf7\xe7\xfc\
+;\x19\xd8\xd6\x16\x00\xa0\x00\x86y\x17\x03K\xa8n\x1e\
+j}y\x98\xa1\x9b5\x0c@\xe8Po\xb6\xf27\x86\
+#|\xffk\x7f:Ql\xbf]&\x16h\xc4\xdb\x0a\
+>\xf0K\xc3\xc00<\x99\x89\x08\x22\xa2\xc1\xb2\x10X\
+\x87WU\x13\x07\xfa\x81\x18\x10Q~\xc46\xbcb\x8b\
+\x1e%\x90\xf4\xe7\xf1\x83,S\xa8w8\xf0 \xb0h\
+\x18\xb4\xaf\xa9\xdfP\xf7rk\x86p0\x189\x00\xb6\
+\x04p\x0c\xc3\x10\xcb\xb2\x5c\xd343j\x98eY\x85\
+ha\x02x\x1b\xd8\x88\xb7\x01\xe3\x13\x8a\xce3\x01O\
+\x9b\x11}\x1f'\x01o\x8c@\xf3\xfd\xaf\x7f8\xa0\xfe\
+\xe1\xd1\xbf\x05\xdc\xae\x84\x9b\x8a\x00\xea\xea\xead\xf1\xe2\
+\xc5\xb2t\xe9\xf12\xf7\xa0\xb9\xa9\x896\x0cC\x0c\xc3\
+\xd0u\xf5\x89\xb4+\x9b\xf9\xe8\x046\x01\xdfV\xa1Y\
+c\x86\xfb\xb9\x00\xaf\x02y$\xc2\xd7\xf7\x9e\xc4\xab\x02\
+\x0eB\xbf\x02\x85\x7f\xb0a\x18O)\x8dwBvH\
+V\xac8[~\xf6\xd3\xbbd\xc7\x9fwJ\xcb\xfe\x88\
+4\xefk\x95\xb7v\xef\x95\xc7\x1e]'\xe7\x9e{\xde\
+  \xe4\x89\xc3\x939@\xd1\xac\x92:_\xc3K/\
+\xaf\xce\xa0\xc9#\xd1\xfe\x8d\x81\xf6\x17.\xfc\x03\x0d\xc3\
+xMO\xe0Yg}T\x9e\xfd\xe3\xf3\xd2\x17\x8dK\
+2\xe6JwgT\xda#\x9d\xd2\x1e\xe9\x94\xce\xf6.\
+\x89\xf5%$\xde\x9f\x94{\x7f\xf1K\x996mz>\
+\x10d\x02E\x92\xc1\xd5F\x99\x04\xee\x8e@\xf8~\xe6\
+\xfa\xfb@\xfb\xf3;|&0\xcd\xb2\xac-\x80TW\
+W\xc7o]s\x9b\xc4\xfa\x12\xd2\x17\x8dI\xf3\xbeV\
+\xd9\xf7v\xb3\xb4\xec\x8fH\xcb\xfe\x88DZ\xda%\xd2\
+\xd2\x9eb\x03qD\xd6\xaf\xfb\xbd466js0\
+\x5ca\xb9\x19\x00\xe1\x8eB\xf8I\xf5\xde-\xbe\xc4O\
+\xd0\xd1$\x97\xf6[\x96u/ 3g\xce\x8c\xff\xee\
+\xa1GD\x92\x22\xad\xcdm\xb2\xff\x9d\x16\x89v\xf7I\
+\xbc?)\xbd=\xfd\xd2\xdf\x1b\x97HK\xbb\xb4\xb5v\
+\xa4\xae}o7\x8b\x88\xc8\x9a[n\x15@\xb29\x8c\
+\xc3\x04\xc4h\xde\xaf\x19\xe4\xa2@\xfb\x0bH\xb0TU\
+U\x9d\x07\xc8\xe1\x87\x1d\x9ex\xee\xd9\x17$\x19w\xa5\
+y_\xab\xb46\xb7I_4./oyE\xbe|\
+\xd5\xd5\xb2b\xc5\xd9\xf2\x8b{\xee\x93\xfe\xde\xb8\xb46\
+\xb7\xa5\x00\x10ii\x97\xd6\xe66\xe9\xe9\xea\x95SN\
+>e8\xd1\xc1\xa0\xcb0\x0c1MSL\xd3L1\
+\xc9\x08\xd8DS\xff\x16`\x8a/\x09\x15\x8c\x0c\xd4o\
+,X\xb0\xa0\xde0\x8c]MMM\xf2\xa7W\xb69\
+\x89~\xc7'\xfc\x98l\xda\xf8_2k\xd6\xacA\x93\
+\xfc\xc0o\x1e\x94X_BZ\xf6GR h\xde\xd7\
+*N\xc2\x95[\xd7\xdcV0\x0b\xa8\x103%\xf0l\
+\xaf3MS,\xcb*\x04T~3\xf2\xfe@\xfb\x0b\
+\xd0\xfeP(\xf4Y@n]s{R\x1c\x91}o\
+7K[k\x87\xb4\xb7vJkK\x9b,:n\x91\
+\x00RUU%\xa1PH\x009\xf6\xd8c\x87\x98\x81\
+HK\xbb\xf4t\xf5\xca+[\xff$\xa6\x99_\xfb3\
+\x01$\x1c\x0e\xcb\xbcy\xf3d\xee\xdc\xb9\xd2\xd44[\
+\xa6O\x9f1\xe4uy\x80\xa5\xa9\xff'\x13Y\xf8F\
+\xb1\xfe\xc7\xf9\xe7\x9f\x1fz\xe0\x81\x076\xcf\x9bw\xf0\
+q/<\xb7YjkkM\xc7qp]\x97\x86\x86\
+\x06\xd6?\xb1\x9e\x8f\x9d\xb3\x02\xd34\x11\x19H\xa0\x99\
+\xa6\xc9\xda\xc7\xd7\xf1\x81\xf7\x7f\x90\xae\xae.,\xcbB\
+D\x08\x85BD\x22\x11\xdes\xd2\x09\xb4\xb4\xb4`\x18\
+\xc6\xa0\xf7\xf9\xdf\xef\xba.\xd3\xa6M\xe3\xcc3\xced\
+\xd9\xb2S9\xfa\xe8\x05L\x9f6\x9d\xfa\xfazD\x84\
+d2\x81\xe38\xf4\xf4\xf4\xb0c\xe7\x0e\xb6n\xdd\xca\
+\xf3\xcf?\xc7\x0b\x9b_\x18\x94\x8d\xf4\x0d\xbd\xde\xbf\x1f\
+X\x0a\xbcC\x85U\xfb\x96\xdd\xf1\x0b\x87\xc3\xa7\x00\xf2\
+\xe9O_$\xb1\xde\x84\xb46GRt.\x8e\xc8\x1d\
+\xb7\xdf)\xa6i\x8am\xdb)-\xd3,\xf0\x95U\xab\
+%\x19\x97\x94\x19\x88\xb4\xb4KwgT^\xdb\xbeS\
+\xc2\xe1p\xc6\x90P\xdbx@>s\xd1\xc5\xf2\xda\xf6\
+\x9d\x92\xe8w$\x11s\xa4\xbf7.\xd1\xee>\xe9\xea\
+\xe8\x91\xae\x8e\x1e\xe9\xee\x8cJOW\xaf\xf4Ec\x12\
+\xefOJ2.\xd2\x17\x8d\xc9\xb5\xab\xbf\x9ab\x02\xdf\
+\xff\xd7\xd4\xef\x00+&:\xf5\xdb\xc5b\x80x<~\
+\x0e \xf3\x8f\x98\xefVM\xb1-\xb7K0M/\xe7\
+\x1f\x8f'9\xe4\x90Cq]\x17\xc30\xb0m\x1b\xc3\
+0H$\x12\x1c\xb3`!\x9f\xfa\xe4\x85\xf4\xf6F1\
+M/\x85\xe0\xba.S\xa6L\xe1\xd9\xe7\x9e\xa1\xbb\xbb\
+{\x88\xf6\xebu\x04\xd7u\xf9\xdau_\xe3\xdb\xff\xfc\
+]\x1c'I{G\xfb\xa05\x86\xb4\xb5\x86\x81\xa4\xbe\
+\x08\x96eq\xd3M\xdf\xe7\xc0\x83\x0eb\xf5\xeaU\x9a\
+ID\xbd\xce\x02\xae\x03\x1ec\x9co\xef.V\xd2f\
+4\xc2w\x00;\x99L\x9e\x06\x18uuu\x86\x7f\x89\
+\xc4\xb2,zzzX\xbe|9\x17\x7f\xe6\x12\x1c\xc7\
+!\x99L\x92H$X\xb6\xecT\x1e}\xe41\x16-\
+ZD<\x1eO\x09LS\xfb\xa6M\x1bS\xffc\xd0\
+\x87\xaa\xd7\xfd\xe0\xe6\x1fr\xe3\x0d\xffB4\xdaCo\
+o/\xb6mcY\x16\xa6i\xa6L\x8d\xeb\xba\x98\xa6\
+IUU\x15\x96e\xa5\x00\x08\xd0\x16ic\xd55W\
+\xb3j\xd5j\x1c\xc7A\xb1@\x12\xb8\x1eo\x97\xcf\x84\
+\x16~\xb1\x18\x00`\xa6a\x18\xc7\x00D\x22\x11#\x83\
+\xa9&\x99Lr\xdb\xad\xb7\xb3p\xe1B\xd6\xaf_\xcf\
+\xe9\xa7\x9f\xce\xca\x95\x9f\xa5\xbe\xae>e\xfb\xb5\xf6\xd7\
+\xd4\xd4\xf0\xdak\xaf\xb1n\xfd:\x00\x1c\xc7\x19b\xf3\
+\xbf\xf4\xc5+Y\xb5\xea\x1aZ\x9a#X\x965\x08$\
+Z\xdb\xc3\xf5a,\xdb\xa2\xb3\xb3\x93\xb6\xf66\xc2\xf5\
+a\xea\xea\xea\xe8\xed\xed\xc50\x0cL\xd3\xa4-\xd2\xc1\
+\xb7\xae\xff\x16\xafl}\xd9\xdd\xb8i\xa3iY\xd66\
+\xc7q\xbe;Yl\xbe]\x04\x06q\x80\x05\x22R\x0f\
+\xc8\xb6\xed\xdb\x8ch\xb4w\x90@\x0c\xc3@;\x84\xd7\
+\x5c\xbd\x8a/_u5\x96e\x11\x8dF\xe9\xef\xef\x1f\
+\xf4Z\x0d\x80\xdb\xef\xb8\x8d\xb6\xb66,\xd3\xc2q\x9d\
+\xd4\xffq]\x97p8\xcc\x95_\xba\x92hO\x1f\xa6\
+i\x0eb\x0e\x11\xc1\xb6ml\xdb\xe6\xc9\xa76\xf0\xc0\
+o\x1f`\xdb\xf6mtuu\x12\x0eO\xe5\xd2K.\
+\xe3\x8a\xcb\xaf \x1a\xf5LN2\x99d\xda\xb4F.\
+\xbf\xfcsl\xdc\xb4\x11\x11q\xf0z\xfc\xf5M\x86\x98\
+\xdf.\x82\x09\x008\xcau]\x00\xf9\xf3\xf6\xedF\x7f\
+\x7f?\xb6m\xa7l\xbe\x16\x9e\x88\xd0\xd9\xd9\x99\xfa^\
+S\xb5\x1e\x8e\xe30u\xeaT6\xbf\xb8\x99{\xee\xb9\
+\xdb\x13\xb8\xb8\x83\xb4\xdfq\x1c\xce^\xf11\xe6\xcf?\
+\x92\xce\xce\xce!\x9ao\xdb6mmm\x5c}\xcd\x97\
+y\xf4\xb1G\x86>\xb0e\xb1\xf2\xb2\x95\xa9\xfb2M\
+\x93x<\xc1\x8c\x1930M\x0b\xd7uBs\xe7\xce\
+\xe5\xad\xb7\xde\x9aT\x0b7\xa3\x1dsD\x04\xc30d\
+\xf7\x9e\xddl\xd9\xf2\x22555(P\x0cb\x02m\
+\xa3\xb5=\xf6k~(\x14\xa2\xbb\xbb\x9b\xab\xae\xba\x92\
+h4\x9a5\xf4[\xb2x\x09\xb6m\x0d\xf9\x9b\x88P\
+]]\xcd\x9bo\xee\xe1\xd1\xc7\x1eI\xd9{\xfdy\xa6\
+i\xb2{\xcfn\x22m\x11l\xdbF\xdd3\xc9D\x92\
+9\xb3\xe7P[[\x03`&\x12\x89I\xb3\xdaW4\
+\x00(m\x12\xc7q\xf8\xd1\x9a\x1f\xa5\x84\x97\x0e\x82L\
+C\xbf\xa6\xbe\xbe\x9e\xaf^\xb7\x9a-/m\xc1\xb2\xac\
+!\xef\xd5?O\x9f1\x83d\xd2\x1d\x04 ?\x8b\xd4\
+\xd6\xd5\xd1\xd0\xd0\x80\x88\xa4L\x8f\xbe\xa2=Q::\
+:R\xcca\x18\x06I'\xc9\xec\xd9\xb3\xa9\xaf\xafG\
+9\xb4\x01\x00\x869\xaa\xf5\xe4\x1b\x86\xc1\x93On`\
+\xed\xda\xc7\x995{\x06\xb6\x1d\x22\x99L\xe28N*\
+\x1c\xd3\x97\xe388\x8eCUU\x15\xe1p\x98\xd5\xd7\
+\xae\xe6\xae\xbb\xef\xc2\xb2\xacA\x8e_\xfa\xa8\xad\xad\xc9\
+\xc8\x0c\x86\xe1\x81\xa4\xb6\xa6\x86\xaa\xaa\xeaA\xe6\xc54\
+ML\xc3\xa4\xa9\xa9\x89\x03\x0f8\x90D\x22\x91\x02\x90\
+\x17vV\xd3\xd0\xd0\x08\x10=\xf1\xc4\x13\xe3\x01\x00\x0a\
+\x1bZ\x0a\xa1t*^y\xf9e\xfc\xd3\xd7\xbfA{\
+{\x1b\xb3f\xcd\xa0\xb1\xb1\x91\xea\xeajB\xa1\x10U\
+UUTWU3u\xeaT\x1a\x1b\x1b\x89F\xa3\x5c\
+\xb3\xeajnY\xf3\xc3\x9c\xc2\xd7\x02\xdd\xf5\xfa.B\
+\xa1\xa1&\xc00Lb\xb1\x18\x87\x1cr(\x0b\x8f9\
+&eVB\xa1\x10\x8e\xe3\xe2\x8a\xcbu\xd7}\x9d\x86\
+\x86\x06\x92\xc9d\xfa{\xa5\xaa\xaa\x0a`\xdf\x86\x0d\x1b\
+bT@\x87\xaf\xf1\xe4\x04\xb6\xeb\x9f\xb5P:::\
+\xf8\xdeM7r\xdf\xaf\xee\xe5cg\x9f\xc3\xe2E\x8b\
+Y\xb2t)3g\xcc$\x16\x8b\x11\x8b\xc7\xd8\xf5\xfa\
+\xeb<\xbe\xf61\xd6\xaf_\xcf[{\xdf\xc2\xcc\xa3\xf9\
+Zc\xff\xfa\xfa_\x90\x1c\xb2q]\xe1\xc6\x1b\xbe\xc7\
+e+/e\xc7\xce\x1d\xa9\x5c\xc27\xbfq=\x97\x5c\
+|\x09\xdd\xdd\xddC\xa2\x14\xc30\xc4\xf1@\xb1\xdf\x97\
+\xfdKNt\x00\x18E`\x10\x17\xaf\xc2v\xb3\x8f\x09\
+\x0c\x1dg\xfb\x05Z]]Mmm-\xfd\xfd\xfd\xb8\
+\xaeK,\x16\x1b\x12\xdf\xe7\xfc0\xf5\x9aC\x0f=\x8c\
+\xffy\xfa\x8f\xd4\x87\xc38Nr\x88/\xe0\xba.\xf5\
+\xf5\xf5\xec\xdd\xbb\x97\xbb\xee\xfe9}}}\x9c\xf1\x91\
+3Y\xbe\xfc4\xa2\xd1\x9e!\x8e\xa3eY\xf4D{\
+\x9c%K\x17Y---7\x1a\x86\xf1\x0d\x11\xb1\xcb\
+\x00\x00\x93\xc1-\xe6\xfc21\x18Z\xd30\xae\xcd\xc8\
+o\x18\xda\x04J\x0c\xc3\x10\xdb\xb6\xb3.\xd1\xe6\xfa\x1b\
+9V\xfe\xee\xfc\xf7\x1f\x8b\x93\x10i\xde\xd7:h%\
+Q_\xad\xcdm\xd2\xd5\xd1#nRD\x1c\x19Rw\
+\xa0\xaf\x96\xfd\x11\xe9\xef\x8d\xcb\xc6\xa7\x9evB\xa1\x90\
+\x98\xa6\xf9y\x05(\xabD\x0ag\x8f\xe2\x7f[\xc5\xce\
+M\x18E\x02\x80\xe0\xb5xy\x16\xafp\x22c\xd9T\
+\xba\xa6fr\xe4\xf2~\x98J\xf1\x1es\xccB6\xfd\
+\xe1il\xdb\xc6q\x9cA\x0e\x9f\xff\xffk\x06J\xcf\
+9\xf8\xd9\x22\x5c\x1f\xe6\xc2O\x7f\x92\x87\x1e~\xc8\x99\
+6m\xda\x92\xf6\xf6\xf6W)n\x9b7\xc3\x974\xf3\
+\xffn\x01p\x22\xdeF\x15\xdd&O\xef\x83H\xe0\xed\
+\x8bx\x03o\x07\xd3\x9bi,!\xe3\x91\x05\xbe\xe0c\
+\x81\xd1\x96b\xe5e\x81\xcb.])N\xc2+7\xcb\
+\xa4\xdd\xf9\xae\x96\xfd\x11\x89\xf5\xc5e\xfd\xda'\x92\xaa\
+z\xe8\xa5\xe3\x8f?>TD\xe5H?)=\x0c\x9c\
+\x8f\xb7\xfd\xedU\x06\x0e\xd1\xccwu\xe1\xb5\xd0\xb9\x06\
+\xa8*\xe2\xfd\x15\x95\xe6,\xbc\x8e\x9f\x87\xa16\x82P\
+\xa2\xf2i\x9dE\xdc\xba\xf5el\xdb\xe6C\x1f\xfa;\
+D\x84D\x22\x91J\xeed\xca\x11db$\xd3\xb2\xb9\
+\xe2\xf3\x97\xbb{\xf6\xec6L\xd3\xbc\x7f\xef\xde\xbd\xeb\
+\x15M\xbbEbFQ\x82\xff\x1c\xf03\xa5$'\xe1\
+u\x1d\xd3g\x0d8>[\xaf\xf7\x1fj\x052T\x98\
+=\x07\xef\xb4\xd5S\xf1V)\xfb\xc7[\xaaZ\xd3\x5c\
+\x0d^g\xad!\xfe@\xa9\x98\xe0\x82\x0b>)o\xfc\
+m\x8f\xc4\xfb\x93\x92\x889\xd2\xd5\xd1\x93\xaa4n\xd9\
+\x1f\x91\xd6\xe6\xb6!UG\xfb\xdfi\x117)r\xf3\
+\xcd?\x14@\xefV:\xbdH\x8aa\xf9\xc2\xe3/\x02\
+;\x19\x5cg\x98\xf0\x09\xba\xd0\xc2VG\x99\x06\xc1\xeb\
+E\x0c\xe3p\x7f\x82Fd\x8dBi\xd9\xccASS\
+\x93\xac\xbc\xec\xb3r\xff\xaf~-\x7f\xd9\xf1z\xaa\xfa\
+8\x19w%\xda\xdd'\xed\x91\xce\x94\xa9\xf0j\x0eE\
+\x9e\xdc\xf0\x94\xd4\xd6\xd6:\xa6i\xba\x86a\xec\xc2;\
+\xdca\xb4\xf4\xaa\x85\x7f8^\x07\x11\x7f\x89\x99\xc3\xe8\
++\x9c\x1d\x15v\x8f\xdb\xa3h4*\xa7\x00\xf7\xa5\xdd\
+xI@\x90^\xe0\xd9\xd4\xd4$\xa7\x9c|\x8a\x5c\xfb\
+\x95k\xe5\x97\xf7\xdd//\xbd\xb8U\xf6\xefk\x95\xbe\
+hL\xa2\xdd\xfd\xe2$D\x9e\xda\xb0Q\x9a\x9af\x0b\
+j\xcf\x22\xde9?\xa3\xd5~\xfd\xec\x1fg`;|\
+\xa2D\xcf\xbe\xac\x18,`\x94\x10\x04\xda\x86~\x07\xaf\
+\xc0\x02\xa5\x05V)>W\xe7\x1d2\xad?444\
+0c\xc6L\x0e<\xe0\x00\xaa\xab\xa7\xe08I\xb6\xbc\
+\xb4\x85\x9e\x9e\x1e\xd74M\xc3u\xdd\xdd\xcao\xe9L\
+\x8b\xc9G\xf2\xcc\xd7\xabg\x86\xfc\xbb\x8f%\xcbg\x99\
+\x05d_/\x04~\xcd8.Z\xf1w\xf9\xf8\x14\xde\
+\x96\xee\xf4\xdd6%a\x04]/\xa8\xcb\xc4\xb3\xd1\xa9\
+a\x18\xdaG9g\x94\xda\xa4\x85\xfc\xfe\x02\x18\xcf\x19\
+\xa59\xd0\xd5\xca\xab\x8a\x94\xcd-9\x08\xf4\xe4\xcc\xc4\
+\xeb\x18\x9e~^@I\xc1\xc0\xa0M\x22\x96\xde\x13\xe0\
+\x18\x86\xa1\x05p\xcb(\x85\xaf\x81\x1eRQ\x90\x9b\xc3\
+\xf9M\x17z\x0b\xb0\x0b\xafA\xd5\x0e\xbc\xbeC\xbb\xc9\
+\xbf=^\xf0\xce_\x18\xf7\x00\xc8\x14n\xbeW\x85C\
+\xfb3 \xdb)1\x18\xd2\x85\xf3\xcd\x22d\xd8\xf4\xb3\
+]I\xee\xdd\xc7\xfa\xb9t<\x7f\x12\x03'\xa76\xa8\
+\xab\x1a\xb8\x98\xec\xcd\xb4\xfc\x00\xf8\x0f_\xa4Q1\xeb\
+\x0e~-;\x18\xb8\x0a\xaf}\x5c\x8c\xcc\x1b2\x8b)\
+x\xbf`\xf60\xd0\xdeu4\x9b=\xf5{g+@\
+g\xdb\x84\xea\xf8h;\x9f\xc0./\x10\x00?\xae4\
+\x00\xf8\x1d\x9ct\xc7h\x11p-\xf0B\x11\x05\xee\xfa\
+\xec\xad\xfe}\x0c\xf8O%\xb0b\xc4\xfb\x9a~\xaf\xcb\
+\xa1\xfdZ\x90\xbfI3\x8b\xe9\x0d\xaf\xf4\xd9\x89WO\
+t\x00\xa4\x03!]\xfbN\x01\xee\x00\xf6\x92\xbb\xa1T\
+\x22\xcb\x95I\x08}\xcac>\xa1\x88YP-\xb8)\
+\xc0\xf6,\x8e\x9f\xfe\xdd~\xe0 \x06\xaf\xfee\x03\xd3\
+?\xe61%E\x05\xc0X:\x10n\x1a\x18t\x19\xf6\
+\xb3\xea\x8a\xe2u\xf6Hf\xb8O\xb3\x00\xa7\xad\x0d\xef\
+\x00\xa7\x87\x94\xf6m\xf5\x09\xde-B\xe8\xa4\x17wN\
+W\x8b:\x99N\x12\xd1\x87I\xfc\x9b\x02t!![\
+]\x81\xa1{d\x14!\xeb\xb8\x00@&0hz\x0c\
+\x03\xe7e\xf0\xce\xf5$o\x00~\x85\xd7\x7f\xd8\xf1\xb1\
+B\xaf\x02N;\xde\xea\xd9\x9b\xbe\x097}\xb1y1\
+\xfc\x19=\xf1Wd\x89\xe7\xb5\xf0w\xa9\xd4m\xa1\xab\
+\x8bV\x81\x00\xd85\x91\x00\x90\xaeU\x1f\xc5\xeb\xdf\xeb\
+f\x01\xc0v\xe0\xaeax\xe9Bq7yh\xb6:\
+R1\x80\x91ApZ0w\xe2\xb5\xbc+V\x81\x89\
+^d\xda<\xd1\x00\xe0\xd7\xaa\xcbsd\xc9\xc0\xeb\xef\
+k\xe7\xd0\xaat\x7f\xa1T\x99\xceO(\x1f =\xe3\
+'\xea\xe7N\xc5T\xc3a\x9e\x5c\x05\xa9z\x85u\x1b\
+\xde\x02\x931\x91\x00\xa0\xb5\x7f\x19\xd9[\xb1i\xfak\
+\xf4iS\xb9\x8b#\xf4~\xc8*\x05\x80l\x82\xb2\xf1\
+N\x1a\xdb[ \xfd\xebgh\xce\xf1Z\xbd<|\x8f\
+\x02\xca\x84\xda\xbb\xa8\xa9\xfe\xe1\x02B\xaa\xcd>\xf0\x8e\
+\xc5\xe1\x12(\xa0f\xebA\xa4\x7f7\x9c\x9e\x82\xfa5\
+g3\xb4C\x89?A\xf6\x06\x15v6\xe1p&\xf5\
+\x04\x85\xec|\x09\x95\xd7\x19\xe8>>V\x00\xb8#\x0b\
+P\xf5\xcf\xcf\x0f3\xc3\xa8\x05Z\x07\xdc\x9f\xe1\xf9\x1d\
+\xbc\xd4\xf1\x19E\x0ac\xc7\xa5\x13\xb8Z\xc5\xb5\xd9V\
+\xd1\xfc\xdd\xc7\xa7\xe0\xf5\x0b.\xb7\x9f\xe2\xe2U\xe7\x9c\
+\x9f!J\xf1\x8f\x87}\xa6\xa0\x10\xe7O\x9b\x80(\xde\
+\xe2\xd9\x1a`\xb1\x8at\xde\x01\xfe\x0f\xafWr\x07\x13\
+\xec\x84\x12-\xe8\x85*\x8c\xcb\xd5\xd3\xcf\xf5i\xc3X\
+\xb4k\xb7|@\xcdw\x9c\xdcq#\xbc?c\x94\x7f\
+\xafX\x00\xfc\x84\xe1\xb5r]\x5cf\x00h\x8a\xae\xc9\
+\x91\xf9\xd3\xf7\xbe\xa5\x08\x14\xad\x9b\x5c\xdb\xbe\x88\xa7\xe8\
+\xc2\x1fk\x13\xa0\xbd\xe3#\xf0\x9a9K\x01\x02\xd5\x9e\
+\xf0\xac2k\x84\x8eR\xce${\xe6O\xd3\xf8\xfaa\
+\xd2\x7f\xb6\xe4\x98[\x8e\x87\x1a\x0f\xb1\xffUx\xd9?\
+w\x18\x02\x9dY\xe6{\xd5\xc0\xfbb\x8e\x04\x8c>\xaf\
+`]1\x924\x13}hJ\x9b\x87\x97\xb7/\xb4\x9f\
+\xaf\xe3\x03M\xb9XL+\xca\xd2\x1cQ\x8a\xbe\xaf\xd7\
+\xf0m\x91\xab\x94\xd8{,\xb5\xff\x0b*\xae-T\xfb\
+e\x0c\x18@\xdf\xd7\xe7\x94p3\xdd\xab\xa6\xebu*\
+v\xb7\x02\x06\xc8\xefP\xcd\xc1\xab\x9e\x1dN\xd5\xb0^\
+\x0e\xbd]\xfd\xafP\x99\x84?S\x85c\xb9\x8e\xbes\
+)\xde\xde\x82\x09\xcd\x00zA\xe3\x02\xbc\xe2\x0cw\x04\
+\xf72-M\xf3J=G\xcb\x15`\xb39\x7f\x06\xde\
+\xea\xe33e\xba\xaf\x8a\x06\x80\x9e\xb0sG@\x93\xfe\
+d\x10\xc3t\x1cG3\xce\xcb\xe1\xd8\xe9\xa4\xcc\xefU\
+.\xc3\x0c\xe8??\xe8\x8e\xc4[&\x1d\xeea\x0e\x9a\
+~\xb72p\x12Y\xa9\x00`\xf8\xd8f7\xf9\x8f\xbe\
+\x0dN\x14\x19F\xe2\xe7\x1f\x18\xd9\x19>\x1a,\xfb|\
+\x8e\xa0Q\xe2{}/C7m\xa6\x0b\xffo*I\
+T\x11\xde\xffX\x9a\x00M\x8d\xe7\x8eR+g\xa9\xdc\
+A9&|!\x03I\xabl\xde\xff\x83x\xb5\x87\x15\
+\xe5\xfd\x9bc\xf0y.p\x14\xf0\x1e\x0a\xcb\xfce\x03\
+\x91\x89WhY\x8eqr\x8e\xfb\xd0\xbd\x84\x1e\xacd\
+{\x5c\xeex\xfa|\xbce\xcf\x91:pZ\xc3\xe6\x95\
+\x98\x01\xf4\xfd-\xca\xe3\xcc\xeed\xa0D\xcb\x09\x00\x90\
+]\xf8\xaer\xdc.\x1c\xa5\xe04\x00\x0e.!\x00\xb4\
+'?\x0f84\xcb|i\xfa\xdf\xc8@\x11h\xc0\x00\
+y>\xeb4\xe0\xdd#\x8c\xfd\xd3\x010\xb7\x84\x00\xd0\
+\xffs>\xde^\xfcLl\xa5\x7f\xfe\xefJs\xfe\xc6\
+\x02\x00\xdak\xfe\x0c\xa3o\xc0\xa4'\xfa\xc0\x12']\
+\x0c\xbc\xfc\x7f\xa6\xcf\xf0\x17~>W\x89\xf4_N\x00\
+h\x81\xcf\x01\xce*b\xac<\x9b\x81eZ\xa3D\x80\
+}_\x16\xed\xd6\x80x\x05\xaf\xf0\xb3\x22;\x8b\x96\xbb\
+\x98\xe2\xc3\x8aNG+0\xc3\x07\x80\xfa\x12\xdc\xa7\xde\
+\xb7W\xcb@e\x8f\x91\xc5\x0c=\x11$\x7f\x0a\x17\xd8\
+#\x8c\xfc\x00\xe7L\xc9\xa0._(8\x92\xd2+\xbd\
+?\xd1\xce\xf2\xfe\x8b\x18\xdc\xc5+}\xe1'\x81\xb7\x97\
+1\x00@\x01,3\x0f\xaf\xa0\xb1\x18\xc7\xb9\xfa\xafc\
+\xf3\x00@\x0b\xda\xce!h\xff\xa8S\x89\x9fk\xf1\xf6\
+\x16\xe6\xca\xfe\xbd\xce@:\xba\x22G\xb9\x8a)\x5c\xbc\
+R\xaa\x06\xf2\xf7\xcd\x19\x8e\x8d\xd6\x05%\xaf\xfa\x04k\
+\xfal\xb4\x9b\xa6\xb5\xfe\x11V\xe1\xdd\x91x%i\xf3\
+U\x82j>^\xee?\x94'?`\x02O\xe1m9\
+\xaf\xd8\x0d\x1a\xe5\x00\x80\x9e\xf8\x15%\xf8\xbf\x96/\x19\
+\x94\xcc\xe2\xadO\xc5k\xd96\xdf'\xe8\xa3\xf1\x1aZ\
+60\xd0y3}\xe8mXF\x16P'\x81_T\
+:=\x97\x0b\x00S\x18\xc8\xa6\x15\xdb\xf1\xd4\xb9\x80\x99\
+x\x1bJ\x8fP\x02?\x0a\xafx\xf3]\x0a\x04U9\
+\x98\xc4\xbf\x83\xd8\xc8c\xd3\xb5\x03\xbb\x19o\xed\x7fB\
+\xd5\xe8\x97\xca\xfe/e\xa0\x0dL\xb1\xec\xbf\x7f\xab\xd4\
+\x0bx\xbbfb\xe4^F\xd6M$\xb2\xad\xec\x15\xd2\
+\xa1+\xae\xbe\xbf4p\xfe\x0ag\x98\x8b\x8b\xe4\xfd\x17\
+Z/\xa0;\x85\x8cT\xd0\xfe\xf62\x99Z\xba=\x83\
+W\x90R\xf1\xfb\xf3Jm\x02\xc4\xc7\x00\x94(Q\x22\
+>\x87P\xb3\xceHW\x18]\x9fVg\x8a\xfb\xb7\xe2\
+m\xf7\xbe\x9d\x81s\x05%\x00@~\x07pi\x09\x13\
+O\xc3\xd5BI\x03NzN@\xdf\xf7\x0e\xbcnb\
+\xbb\xf06zn\xc1\xdb\x9f\x17\xf3\xbd\xa7\xe2\xcb\xbe\xca\
+\xc1\x00\x06\xe5[\xb7O\x07\x9fd\xc9\x09d\xca\xec\xb5\
+*!?\x01<\x89W\x02\x16\xcd2g\x0e\x13\xa4\xe6\
+\xaf\x94\x00\xd0\x1a\x12\xca\xe1\x81\x97J\xe8F\x0e\xb6q\
+\xf06\xa2\xb4\xe15Zz\x15X\xab\xe8\xfd\xad\x0cN\
+\xac\x99\xc1\x11\x9cpNZ\xa9\xb4\xdfT^\xf3\xf3x\
+U\xb5Rb\xc1\xfb=\xf2\xbdx-X_T4\xde\
+\xac\xaeN\xbc\x8cd'^Qj\xba\xc0\xd3\x0fk\x9a\
+\xf0\x07H\x97rh\x81|TMh\x9c\xd2v\x00}\
+[9h\xcb\x19h\x06\x99\x8f\xa5\xf4!Nf \xae\
+\xd2\xe6\x02\xf4\xf6\xef\x98/L\xd3!\x96?\x5c+$\
+lK\xef\x00\xfa\x0e\xf0\xd5\x0c\xbe\x86v\xec\xfc\x97I\
+\x89\xb6Z\x07#\xb7\x97^\x87\xd7\xb4q8\xf1|\x92\
+\xa1\x9d@\xfd1y\x07\xf0\x03\x06\x0aCH\x13t0\
+\x0a\x10N\xb9>G\x14\xdd\xae\xc4K\xd56)\xc1\xcd\
+\xc1[\xd3\x0f+\x90T\x15\xe0\x9b\xbc\x0d\xdc\x8b\xd7u\
+|\xa7O\xf0\xe3\xfa\x80\xc5\xc9\x0c\x80|qs\x0d^\
+f\xadQ}_\x83W\x8c\xa1\xbf\xd6\xe3\xad'\xc4\x95\
+\xa7\xaeS\xbf\x81\xe0+\x08\x00\xe9qx\xa6\x84\xccp\
+\x1d\xccbw\x00\x0d\x000\xc6~B\xfa=\x19ia\
+e\xae$O0\x82\x11\x8c`\x04#\x18\xc1\x08F0\
+\x0a\x1c\xff\x0fiG\xfe\xd5\x121\x0cH\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0e\
+\x03\xa4\x91\xa7\
+\x00r\
+\x00i\x00s\x00c\x00h\x00i\x00o\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x07g9'\
+\x00r\
+\x00i\x00s\x00c\x00h\x00i\x00o\x00_\x001\x002\x008\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa19\x9fh\xcc\
+\x00\x00\x002\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xc4\
+\x00\x00\x01\xa19\x9fh\xec\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,75 +1,227 @@
 """
 Threaded Loading Dialog - A generic dialog for running tasks in a background thread
 """
+import collections
+import functools
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton
-from PySide6.QtCore import QThread, Signal, Qt, QTimer
+from PySide6.QtCore import QThread, Signal, Slot, Qt, QTimer, QObject, QRunnable, QThreadPool, QEventLoop
 
 
-class TaskWorkerThread(QThread):
-    """Worker thread that executes a queue of tasks sequentially"""
+# A task's result together with its position in the queue and its description
+TaskResult = collections.namedtuple('TaskResult', 'index name result')
+
+
+def _gil_enabled():
+    """False only on a free-threaded (3.13t+) build running with the GIL disabled"""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class TaskSignals(QObject):
+    """Signals emitted by TaskRunnable"""
 
     task_started = Signal(int, str)  # (task_index, description)
-    task_completed = Signal(int)      # task_index
-    all_completed = Signal(object)    # result_data
+    all_completed = Signal(object)    # results list, indexed like the tasks
     error = Signal(str)               # error_message
-    progress = Signal(int, int)       # (current, total)
+    progress = Signal(int, int)       # (current, total), tasks before current are done
+
+
+class TaskRunnable(QRunnable):
+    """Executes a queue of tasks sequentially on QThreadPool.globalInstance()"""
 
-    def __init__(self, tasks, parent=None):
+    def __init__(self, tasks, signals=None, parallel=False):
         """
-        Initialize the worker thread
+        Initialize the runnable
 
         Args:
-            tasks: List of dictionaries with keys:
-                - 'function': callable to execute
-                - 'description': str description for UI
-                - 'args': tuple of positional arguments (optional)
-                - 'kwargs': dict of keyword arguments (optional)
+            tasks: List of task dictionaries (see TaskWorkerThread for format)
+            signals: Object owning the TaskSignals signals to emit on, a new
+                TaskSignals by default
+            parallel: Run independent tasks concurrently when the GIL is disabled
         """
-        super().__init__(parent)
+        super().__init__()
+        # The dialog polls and cancels it after run(), so the pool must not delete it
+        self.setAutoDelete(False)
         self.tasks = tasks
-        self._is_cancelled = False
-        self.results = []
+        # Normalized once into (call, name, description) so the loops neither look up
+        # each task's keys nor unpack its arguments while running
+        self._schedule = [
+            (self._bind(task), self._name(task['function']), task.get('description', f'Task {i+1}'))
+            for i, task in enumerate(tasks)
+        ]
+        self.parallel = parallel
+        self.signals = signals if signals is not None else TaskSignals()
+        self._cancel = threading.Event()
+        # One slot per task, each written exactly once, so the list never resizes and
+        # parallel workers need no lock to store their results
+        self.results = [None] * len(self._schedule)
+        # (current, total, description) of the running task, None before the first one.
+        # Replaced as a whole so readers on other threads always see a consistent tuple;
+        # polled by the dialog instead of signalled per task.
+        self.state = None
+
+    @staticmethod
+    def _bind(task):
+        """Return a zero-argument callable running the task with its args and kwargs"""
+        args = task.get('args', ())
+        kwargs = task.get('kwargs', {})
+        if not args and not kwargs:
+            return task['function']
+        return functools.partial(task['function'], *args, **kwargs)
+
+    @staticmethod
+    def _name(func):
+        """Return the name used for func in error messages"""
+        return getattr(func, '__qualname__', None) or repr(func)
+
+    def _error_message(self, index, exception):
+        """Describe exception raised by the task at index (None outside any task)"""
+        if index is None:
+            return f"Error: {exception}"
+        _call, name, description = self._schedule[index]
+        return f"Error in task {index + 1} ({description}, {name}): {exception}"
 
     def run(self):
+        """Execute all tasks, concurrently if parallel was requested and the GIL is disabled"""
+        # With the GIL, threads would only take turns, so sequential is never slower
+        if self.parallel and not _gil_enabled():
+            self._run_parallel()
+        else:
+            self._run_sequential()
+
+    def _run_sequential(self):
         """Execute all tasks in sequence"""
-        func = None
+        signals = self.signals
+        # Bound once, rather than looked up on every task
+        started = signals.task_started.emit
+        progress = signals.progress.emit
+        cancelled = self._cancel.is_set
+        results = self.results
+        i = None
         try:
-            total_tasks = len(self.tasks)
+            total_tasks = len(self._schedule)
 
-            for i, task in enumerate(self.tasks):
-                if self._is_cancelled:
+            for i, (call, _name, description) in enumerate(self._schedule):
+                if cancelled():
                     return
 
-                # Emit task started
-                description = task.get('description', f'Task {i+1}')
-                self.task_started.emit(i, description)
-                self.progress.emit(i, total_tasks)
+                # Emit task started; progress also reports the tasks before it as done
+                started(i, description)
+                progress(i, total_tasks)
+                self.state = (i, total_tasks, description)
 
                 # Execute the task
-                func = task['function']
-                args = task.get('args', ())
-                kwargs = task.get('kwargs', {})
+                results[i] = call()
 
-                result = func(*args, **kwargs)
-                self.results.append(result)
-
-                if self._is_cancelled:
+                if cancelled():
                     return
 
-                # Emit task completed
-                self.task_completed.emit(i)
-
-            # All tasks completed successfully
-            self.progress.emit(total_tasks, total_tasks)
-            self.all_completed.emit(self.results)
+            # All tasks completed successfully, which also stands for progress(total, total)
+            signals.all_completed.emit(results)
 
         except Exception as e:
+            # Nobody is listening for the outcome once the queue was cancelled
+            if self._cancel.is_set():
+                return
             # Emit the error message with the currently running task and the exception details
-            self.error.emit(f"Error:{str(func)} {str(e)}")
+            signals.error.emit(self._error_message(i, e))
+
+    def _run_parallel(self):
+        """Execute all tasks at once on a thread pool, keeping results in task order"""
+        signals = self.signals
+        # Bound once, rather than looked up on every task
+        started = signals.task_started.emit
+        progress = signals.progress.emit
+        cancelled = self._cancel.is_set
+        results = self.results
+        total_tasks = len(self._schedule)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            submit = executor.submit
+            futures = {}
+            for i, (call, _name, description) in enumerate(self._schedule):
+                started(i, description)
+                futures[submit(call)] = (i, description)
+
+            # current counts finished tasks, as it does for the sequential loop
+            for done, future in enumerate(as_completed(futures), 1):
+                i, description = futures[future]
+                if cancelled():
+                    executor.shutdown(cancel_futures=True)
+                    return
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    executor.shutdown(cancel_futures=True)
+                    if not cancelled():
+                        signals.error.emit(self._error_message(i, e))
+                    return
+                if done < total_tasks:
+                    progress(done, total_tasks)
+                self.state = (done, total_tasks, description)
+
+        signals.all_completed.emit(results)
+
+    @property
+    def task_results(self):
+        """The results as TaskResult tuples, independent of the order tasks finished in"""
+        return [TaskResult(i, description, result)
+                for i, ((_call, _name, description), result)
+                in enumerate(zip(self._schedule, self.results))]
+
+    def cancel(self):
+        """Request cancellation of the task queue, honoured between tasks"""
+        self._cancel.set()
+
+
+class TaskWorkerThread(QThread):
+    """Worker thread that executes a queue of tasks sequentially"""
+
+    task_started = Signal(int, str)  # (task_index, description)
+    all_completed = Signal(object)    # results list, indexed like the tasks
+    error = Signal(str)               # error_message
+    progress = Signal(int, int)       # (current, total), tasks before current are done
+
+    def __init__(self, tasks, parent=None, parallel=False):
+        """
+        Initialize the worker thread
+
+        Args:
+            tasks: List of dictionaries with keys:
+                - 'function': callable to execute
+                - 'description': str description for UI
+                - 'args': tuple of positional arguments (optional)
+                - 'kwargs': dict of keyword arguments (optional)
+            parallel: Run independent tasks concurrently when the GIL is disabled
+        """
+        super().__init__(parent)
+        self.tasks = tasks
+        # The task loop lives in TaskRunnable, emitting on this thread's own signals
+        self._runnable = TaskRunnable(tasks, signals=self, parallel=parallel)
+
+    @property
+    def results(self):
+        return self._runnable.results
+
+    @property
+    def state(self):
+        """The latest (current, total, description) of the running queue, or None"""
+        return self._runnable.state
+
+    @property
+    def task_results(self):
+        return self._runnable.task_results
+
+    def run(self):
+        """Execute all tasks in sequence"""
+        self._runnable.run()
 
     def cancel(self):
         """Request cancellation of the task queue"""
-        self._is_cancelled = True
+        self._runnable.cancel()
 
 
 class ThreadedLoadingDialog(QDialog):
@@ -84,7 +236,28 @@ class ThreadedLoadingDialog(QDialog):
     - Customizable callbacks for completion and error handling
     """
 
-    def __init__(self, parent=None, title="Processing", tasks=None):
+    # How long execute() waits for a queue to finish before showing the dialog, in ms
+    SHOW_DELAY = 100
+
+    # Parsed once per dialog; set_error/set_complete pick a state via the "status" property
+    _PROGRESS_QSS = """
+        QProgressBar[status="error"], QProgressBar[status="complete"] {
+            border: 1px solid #555;
+            border-radius: 3px;
+            background-color: #222;
+            height: 25px;
+        }
+        QProgressBar[status="error"]::chunk {
+            background-color: #f44336;
+            border-radius: 2px;
+        }
+        QProgressBar[status="complete"]::chunk {
+            background-color: #4CAF50;
+            border-radius: 2px;
+        }
+    """
+
+    def __init__(self, parent=None, title="Processing", tasks=None, parallel=False):
         """
         Initialize the threaded loading dialog
 
@@ -92,6 +265,7 @@ class ThreadedLoadingDialog(QDialog):
             parent: Parent widget
             title: Dialog window title
             tasks: List of task dictionaries (see TaskWorkerThread for format)
+            parallel: Run independent tasks concurrently on free-threaded Python builds
         """
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -100,13 +274,40 @@ class ThreadedLoadingDialog(QDialog):
         self.setMinimumSize(450, 180)
         self.setMaximumWidth(600)
         self.parent_widget = parent
+        # Snapshot once so recentring never has to query the parent's geometry again
+        self._parent_center = parent.geometry().center() if parent else None
 
         self.tasks = tasks or []
-        self.worker_thread = None
+        self.parallel = parallel
+        self.worker = None
+        # Reads the worker's state on the GUI thread at ~30 Hz while tasks run
+        self._last_state = None
+        # Text last shown on the progress bar, so unchanged updates are skipped
+        self._progress_text = None
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(33)
+        self._poll_timer.timeout.connect(self._poll_worker)
+        # Label changes within 100ms share one adjustSize() layout pass
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self.adjustSize)
+        # Auto-close timers, stopped whenever the dialog is dismissed so they can't
+        # fire on a dialog that was closed by hand or reopened
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self.accept)
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(5000)
+        self._error_timer.timeout.connect(self.reject)
         self.on_complete_callback = None
         self.on_error_callback = None
         self.auto_close_on_complete = True
         self.auto_close_delay = 800  # milliseconds
+        # execute() waits on this loop for queues that may finish before the dialog is needed
+        self._pending_loop = None
+        self._completed_unseen = False
 
         self._setup_ui()
         self.resize(450, 180)
@@ -131,6 +332,9 @@ class ThreadedLoadingDialog(QDialog):
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(0)  # indeterminate by default
         self.progress_bar.setTextVisible(False)
+        # Center the text
+        self.progress_bar.setAlignment(Qt.AlignCenter)
+        self.progress_bar.setStyleSheet(self._PROGRESS_QSS)
         layout.addWidget(self.progress_bar)
 
         # Info label
@@ -153,15 +357,15 @@ class ThreadedLoadingDialog(QDialog):
 
     def _center_on_parent(self):
         """Center the dialog on the parent widget"""
-        if self.parent_widget:
-            parent_rect = self.parent_widget.geometry()
-            x = parent_rect.center().x() - self.width() // 2
-            y = parent_rect.center().y() - self.height() // 2
+        if self._parent_center is not None:
+            x = self._parent_center.x() - self.width() // 2
+            y = self._parent_center.y() - self.height() // 2
             self.move(x, y)
 
     def _adjust_size_for_content(self):
-        """Adjust dialog size to fit content"""
-        self.adjustSize()
+        """Adjust dialog size to fit content, at most once per 100ms"""
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
         # self._center_on_parent()
 
     def set_tasks(self, tasks):
@@ -208,21 +412,44 @@ class ThreadedLoadingDialog(QDialog):
             self.set_error("No tasks to execute")
             return
 
-        self.worker_thread = TaskWorkerThread(self.tasks)
+        try:
+            self.worker = TaskRunnable(self.tasks, parallel=self.parallel)
+        except (KeyError, TypeError) as e:
+            # A task without a callable 'function', or with unusable args/kwargs
+            self.worker = None
+            self._on_error(f"Error: invalid task list ({type(e).__name__}: {e})")
+            return
+        self._completed_unseen = False
+        self._progress_text = None
 
-        # Connect signals
-        self.worker_thread.task_started.connect(self._on_task_started)
-        self.worker_thread.task_completed.connect(self._on_task_completed)
-        self.worker_thread.all_completed.connect(self._on_all_completed)
-        self.worker_thread.error.connect(self._on_error)
-        self.worker_thread.progress.connect(self._on_progress)
-        self.worker_thread.finished.connect(self._on_thread_finished)
+        # Connect signals. Per-task signals are left unconnected so they post no events;
+        # progress is polled from the worker's state instead.
+        signals = self.worker.signals
+        signals.all_completed.connect(self._on_all_completed)
+        signals.error.connect(self._on_error)
 
-        self.worker_thread.start()
+        QThreadPool.globalInstance().start(self.worker)
+        self._last_state = None
+        self._poll_timer.start()
 
     def execute(self):
-        """Start tasks and show the dialog (blocking)"""
+        """
+        Start tasks and show the dialog (blocking)
+
+        If the dialog would close as soon as the queue completes (auto-close with no
+        delay) and the queue succeeds within SHOW_DELAY ms, it is never shown.
+        """
         self.start()
+        if self.worker and self.auto_close_on_complete and self.auto_close_delay == 0:
+            self._pending_loop = QEventLoop()
+            QTimer.singleShot(self.SHOW_DELAY, self._pending_loop.quit)
+            # Nothing is modal yet, so hold back user input (it is delivered afterwards)
+            # rather than let a click re-enter the parent, or this dialog, meanwhile
+            self._pending_loop.exec(QEventLoop.ExcludeUserInputEvents)
+            self._pending_loop = None
+            if self._completed_unseen:
+                self.setResult(QDialog.Accepted)
+                return self.result()
         return self.exec()
 
     def _on_task_started(self, task_index, description):
@@ -230,55 +457,85 @@ class ThreadedLoadingDialog(QDialog):
         self.status_label.setText(description)
         self._adjust_size_for_content()
 
-    def _on_task_completed(self, task_index):
-        """Handle task completed event"""
-        pass
+    @Slot()
+    def _poll_worker(self):
+        """Show the worker's latest task, if one started since the last poll"""
+        state = self.worker.state
+        if state is not None and state != self._last_state:
+            self._last_state = state
+            current, total, description = state
+            self._on_task_started(current, description)
+            self._on_progress(current, total)
 
     def _on_progress(self, current, total):
-        """Handle progress update"""
-        if total > 0:
-            self.progress_bar.setMaximum(total)
-            self.progress_bar.setValue(current)
-            self.progress_bar.setTextVisible(True)
-            self.progress_bar.setFormat(f"{current}/{total}")
-            # Center the text
-            self.progress_bar.setAlignment(Qt.AlignCenter)
-
+        """Handle progress update, skipping ones that would not change the bar"""
+        if total <= 0:
+            return
+        text = f"{current}/{total}"
+        if text == self._progress_text:
+            return
+        self._progress_text = text
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.setFormat(text)
+
+    # Registered slots, so the queued calls from the worker dispatch through the meta-object
+    @Slot(object)
     def _on_all_completed(self, results):
         """Handle all tasks completed"""
+        self._poll_timer.stop()
+        if self._pending_loop is not None:
+            # Done before the dialog was shown; report back and let execute() return
+            self._completed_unseen = True
+            self._pending_loop.quit()
+            if self.on_complete_callback:
+                self.on_complete_callback(results)
+            return
+        self._on_progress(len(results), len(results))
         self.set_complete()
 
         if self.on_complete_callback:
             self.on_complete_callback(results)
 
         if self.auto_close_on_complete:
-            QTimer.singleShot(self.auto_close_delay, self.accept)
+            self._close_timer.start(self.auto_close_delay)
 
+    @Slot(str)
     def _on_error(self, error_message):
         """Handle error"""
+        self._poll_timer.stop()
+        if self._pending_loop is not None:
+            # Show the error straight away rather than after the rest of SHOW_DELAY
+            self._pending_loop.quit()
         self.set_error(error_message)
 
         if self.on_error_callback:
             self.on_error_callback(error_message)
 
         # Auto-close after showing error
-        QTimer.singleShot(5000, self.reject)
-
-    def _on_thread_finished(self):
-        """Handle thread finished (cleanup)"""
-        if self.worker_thread:
-            self.worker_thread.deleteLater()
-            self.worker_thread = None
+        self._error_timer.start()
 
     def _on_cancel(self):
         """Handle cancel button click"""
-        if self.worker_thread and self.worker_thread.isRunning():
-            self.worker_thread.cancel()
-            self.worker_thread.quit()
-            self.worker_thread.wait()
-
         self.reject()
 
+    def reject(self):
+        """Close the dialog, cancelling the task queue without waiting for it"""
+        # Also reached through Escape and the window's close button, not only Cancel.
+        # The running task finishes in the background and its outcome is dropped.
+        self._poll_timer.stop()
+        if self.worker:
+            self.worker.cancel()
+        super().reject()
+
+    def done(self, result):
+        """Close the dialog, stopping any pending auto-close"""
+        # accept(), reject() and closing the window all end up here
+        self._close_timer.stop()
+        self._error_timer.stop()
+        super().done(result)
+
     def set_status(self, text):
         """Update the status label"""
         self.status_label.setText(text)
@@ -289,41 +546,31 @@ class ThreadedLoadingDialog(QDialog):
         if error_message:
             self.status_label.setText(error_message)
 
+        self._progress_text = None
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555;
-                border-radius: 3px;
-                background-color: #222;
-                height: 25px;
-            }
-            QProgressBar::chunk {
-                background-color: #f44336;
-                border-radius: 2px;
-            }
-        """)
+        self._set_progress_status("error")
         self.info_label.setText("")
         self.cancel_button.setText("Close")
         self._adjust_size_for_content()
 
     def set_complete(self):
         """Display completion state"""
+        self._progress_text = None
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(100)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555;
-                border-radius: 3px;
-                background-color: #222;
-                height: 25px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-        """)
+        self._set_progress_status("complete")
         self.status_label.setText("Processing complete!")
         self.info_label.setText("Success!")
         self.cancel_button.setText("Close")
         self._adjust_size_for_content()
+
+    def _set_progress_status(self, status):
+        """Switch the progress bar to the stylesheet rules for status"""
+        if self.progress_bar.property("status") == status:
+            return
+        self.progress_bar.setProperty("status", status)
+        self.progress_bar.style().unpolish(self.progress_bar)
+        self.progress_bar.style().polish(self.progress_bar)
+        # The rules change the bar's height, which polish() alone doesn't relayout
+        self.progress_bar.updateGeometry()